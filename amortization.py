@@ -0,0 +1,184 @@
+import numpy as np
+
+# Column order used by the amortization table on the dashboard
+COLUMNS = ["Month", "EMI", "Principal", "Interest", "Balance"]
+
+
+def monthly_rate(rate):
+    """Convert an annual rate in % to a monthly fraction."""
+    return rate / 12 / 100
+
+
+def emi(principal, rate, tenure):
+    """Monthly EMI for a loan; `rate` is the annual rate in %."""
+    r = monthly_rate(rate)
+    if r == 0:
+        # No interest case
+        return principal / tenure
+    growth = (1 + r) ** tenure
+    return principal * r * growth / (growth - 1)
+
+
+def amortize(principal, rate, tenure):
+    """Full amortization schedule computed in closed form.
+
+    Returns a dict of NumPy arrays keyed by COLUMNS, ready for
+    `pd.DataFrame(...)`. The balance after month k is
+    P*(1+r)^k - EMI*((1+r)^k - 1)/r, so no month-by-month loop is needed.
+    """
+    tenure = int(tenure)
+    r = monthly_rate(rate)
+    payment = emi(principal, rate, tenure)
+    months = np.arange(1, tenure + 1)
+
+    if r == 0:
+        balance = principal - payment * months
+        interest = np.zeros(tenure)
+    else:
+        growth = (1 + r) ** np.arange(0, tenure + 1)
+        opening_and_closing = principal * growth - payment * (growth - 1) / r
+        balance = opening_and_closing[1:]
+        interest = opening_and_closing[:-1] * r
+
+    return {
+        "Month": months,
+        "EMI": np.full(tenure, payment),
+        "Principal": payment - interest,
+        "Interest": interest,
+        "Balance": np.maximum(balance, 0),
+    }
+
+
+# -----------------------------------------------------------
+#                BATCH / PORTFOLIO COMPUTATION
+# -----------------------------------------------------------
+# Columns expected in an uploaded loan book (case-insensitive)
+LOAN_COLUMNS = ["principal", "rate", "tenure"]
+
+
+def load_loans(source):
+    """Read a CSV or Parquet loan book into principal/rate/tenure arrays.
+
+    `source` can be a path or a file-like object with a `.name`
+    (e.g. a Streamlit upload).
+    """
+    import pandas as pd
+
+    name = str(getattr(source, "name", source)).lower()
+    if name.endswith((".parquet", ".pq")):
+        df = pd.read_parquet(source)
+    else:
+        df = pd.read_csv(source)
+
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    missing = [c for c in LOAN_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Loan file is missing column(s): {', '.join(missing)}")
+    if df.empty:
+        raise ValueError("Loan file has no loans")
+
+    principal = df["principal"].to_numpy(dtype=float)
+    rate = df["rate"].to_numpy(dtype=float)
+    tenure = df["tenure"].to_numpy(dtype=np.int64)
+    if (tenure < 1).any():
+        raise ValueError("Tenure must be at least 1 month for every loan")
+    return principal, rate, tenure
+
+
+def emi_batch(principal, rate, tenure):
+    """Vectorized EMI for arrays of loans (zero rates handled per loan)."""
+    principal = np.asarray(principal, dtype=float)
+    r = monthly_rate(np.asarray(rate, dtype=float))
+    n = np.asarray(tenure, dtype=float)
+
+    growth = (1 + r) ** n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amortizing = principal * r * growth / (growth - 1)
+    return np.where(r == 0, principal / n, amortizing)
+
+
+def _growth_matrix(r, periods):
+    """(1+r)^k for k = 0..periods-1, one row per loan, via cumprod."""
+    growth = np.empty((r.size, periods))
+    growth[:, 0] = 1.0
+    growth[:, 1:] = (1 + r)[:, None]
+    np.cumprod(growth, axis=1, out=growth)
+    return growth
+
+
+def amortize_batch(principal, rate, tenure):
+    """Full schedules for many loans as 2-D arrays (loans x months).
+
+    Months past a loan's own tenure are zero. Memory grows with
+    loans * max(tenure); use portfolio_totals() for whole loan books.
+    """
+    principal = np.asarray(principal, dtype=float)
+    r = monthly_rate(np.asarray(rate, dtype=float))
+    n = np.asarray(tenure, dtype=np.int64)
+    if n.size == 0:
+        raise ValueError("No loans to amortize")
+    payment = emi_batch(principal, rate, n)
+    periods = int(n.max())
+
+    active = np.arange(periods)[None, :] < n[:, None]
+    growth = _growth_matrix(r, periods + 1)
+    # Balance_k = (P - EMI/r) * (1+r)^k + EMI/r for r > 0, P - EMI*k otherwise
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(r == 0, 0.0, payment / r)
+    balance = (principal - annuity)[:, None] * growth + annuity[:, None]
+    flat = r == 0
+    balance[flat] = principal[flat, None] - payment[flat, None] * np.arange(periods + 1)
+
+    interest = balance[:, :-1] * r[:, None] * active
+    emis = payment[:, None] * active
+    return {
+        "EMI": emis,
+        "Principal": emis - interest,
+        "Interest": interest,
+        "Balance": np.maximum(balance[:, 1:], 0) * active,
+    }
+
+
+def portfolio_totals(principal, rate, tenure, chunk_size=20_000):
+    """Portfolio cash flow, interest, principal and balance by month.
+
+    Loans are processed in chunks so memory stays bounded at roughly
+    chunk_size * max(tenure) floats, whatever the size of the book.
+    """
+    principal = np.asarray(principal, dtype=float)
+    r = monthly_rate(np.asarray(rate, dtype=float))
+    n = np.asarray(tenure, dtype=np.int64)
+    if n.size == 0:
+        raise ValueError("No loans to amortize")
+    payment = emi_batch(principal, rate, n)
+    periods = int(n.max())
+
+    # Interest for loan i in month k is r*B_{k-1} = (r*P - EMI)*(1+r)^(k-1) + EMI
+    # while the loan is active; zero-rate loans pay no interest.
+    scale = np.where(r == 0, 0.0, r * principal - payment)
+    offset = np.where(r == 0, 0.0, payment)
+
+    # Sum of EMI (and of the constant interest term) over loans still running in month k
+    ends = np.bincount(n - 1, minlength=periods)
+    cash_flow = np.bincount(n - 1, weights=payment, minlength=periods)[::-1].cumsum()[::-1]
+    interest = np.bincount(n - 1, weights=offset, minlength=periods)[::-1].cumsum()[::-1]
+
+    # Loans sorted by tenure: each block shares one width, so no masking is needed
+    order = np.argsort(n, kind="stable")
+    sorted_n = n[order]
+    bounds = np.flatnonzero(np.diff(sorted_n)) + 1
+    for group in np.split(np.arange(n.size), bounds):
+        width = int(sorted_n[group[0]])
+        for start in range(0, group.size, chunk_size):
+            rows = order[group[start:start + chunk_size]]
+            interest[:width] += scale[rows] @ _growth_matrix(r[rows], width)
+
+    principal_paid = cash_flow - interest
+    return {
+        "Month": np.arange(1, periods + 1),
+        "Cash Flow": cash_flow,
+        "Interest": interest,
+        "Principal": principal_paid,
+        "Balance": np.maximum(principal.sum() - principal_paid.cumsum(), 0),
+        "Loans Closing": ends,
+    }
@@ -1,12 +1,15 @@
+import os
 
 import streamlit as st
-st.set_page_config(page_title="RBI Financial Dashboard", layout="wide", page_icon="🏦")
 
-# load css
-with open("styles/global.css") as f:
-    st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+from theme import apply_theme
 
-st.sidebar.image("assets/rbi_logo.png", width=140)
+LOGO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "rbi_logo.png")
+
+apply_theme()
+
+if os.path.exists(LOGO):
+    st.sidebar.image(LOGO, width=140)
 st.sidebar.title("🏦 RBI Dashboard")
 st.sidebar.write("Navigation on the left — open pages from the Pages menu.")
 
@@ -0,0 +1,228 @@
+"""Rolling-origin backtests of the inflation forecasting methods.
+
+    python backtest.py --horizon 3 --min-train 8
+    python backtest.py --dataset world_inflation --methods arima,fast --jobs 4 -o windows.csv
+
+For every origin t (min_train <= t <= n - 1, min_train >= 2) each method
+is fitted on the first t points of a series and scored against the next
+`horizon` points. Methods:
+
+    last    last observed value (the dashboard's old fallback)
+    fast    fast_forecast order search (the dashboard's default)
+    arima   statsmodels ARIMA(1,1,1) (the dashboard's old forecast)
+
+ARIMA windows of one series are fitted in order and each fit starts from
+the previous window's parameters (about 1.3x faster on 120-point series;
+the optimizer can settle on slightly different parameters than a cold
+fit, so use --cold-start to reproduce the dashboard's fits exactly).
+The windows are split into segments
+that run in parallel on forecast_service's pool. The fast method fits
+every series of a window length in one vectorized call.
+"""
+import argparse
+import time
+
+import numpy as np
+
+import datasets
+from fast_forecast import forecast_batch
+from forecast_service import DEFAULT_WORKERS, run_tasks
+
+METHODS = ("last", "fast", "arima")
+MIN_TRAIN = 2  # shortest history any method is fitted on
+
+
+def origins(n, min_train):
+    """Training lengths of every window that has at least one actual to score."""
+    return list(range(min_train, n))
+
+
+def _actuals(values, origin, horizon):
+    """The next `horizon` points after `origin`, nan-padded past the end."""
+    out = np.full(horizon, np.nan)
+    tail = values[origin:origin + horizon]
+    out[:len(tail)] = tail
+    return out
+
+
+def _arima_segment(values, origins, horizon, order, warm_start=True):
+    """ARIMA forecasts for consecutive windows, warm-starting each fit.
+
+    Returns (forecasts (windows, horizon), CPU seconds).
+    """
+    import warnings
+
+    from statsmodels.tsa.arima.model import ARIMA
+
+    t = time.process_time()
+    forecasts = np.full((len(origins), horizon), np.nan)
+    params = None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i, origin in enumerate(origins):
+            try:
+                res = ARIMA(values[:origin], order=order).fit(start_params=params)
+            except Exception:
+                params = None  # a failed window leaves nan; the next one starts cold
+                continue
+            params = res.params if warm_start else None
+            forecasts[i] = np.asarray(res.forecast(horizon))
+    return forecasts, time.process_time() - t
+
+
+def run_last(series_by_name, horizon, min_train):
+    t = time.process_time()
+    rows = []
+    for name, values in series_by_name.items():
+        for origin in origins(len(values), min_train):
+            rows.append((name, origin, np.full(horizon, values[origin - 1])))
+    return rows, time.process_time() - t
+
+
+def run_fast(series_by_name, horizon, min_train):
+    t = time.process_time()
+    rows = []
+    n_max = max(len(v) for v in series_by_name.values())
+    # one batched fit per window length, over every series long enough
+    for origin in range(min_train, n_max):
+        names = [name for name, v in series_by_name.items() if len(v) > origin]
+        forecasts = forecast_batch(np.array([series_by_name[name][:origin] for name in names]), horizon)[0]
+        rows += [(name, origin, forecast) for name, forecast in zip(names, forecasts)]
+    return rows, time.process_time() - t
+
+
+def run_arima(series_by_name, horizon, min_train, order=(1, 1, 1), max_workers=None,
+              warm_start=True):
+    """ARIMA over every window, split into one warm-started segment per task."""
+    workers = max_workers or DEFAULT_WORKERS
+    # enough segments to keep every worker busy, but long enough to reuse params
+    per_series = max(1, -(-2 * workers // len(series_by_name)))
+    tasks = {}
+    for name, values in series_by_name.items():
+        windows = origins(len(values), min_train)
+        size = max(3, -(-len(windows) // per_series))
+        for i in range(0, len(windows), size):
+            tasks[name, i] = (_arima_segment, (values, windows[i:i + size], horizon, order, warm_start))
+
+    rows, cpu = [], 0.0
+    for (name, i), result, error in run_tasks(tasks, max_workers):
+        windows = tasks[name, i][1][1]
+        if error is not None:
+            rows += [(name, origin, np.full(horizon, np.nan)) for origin in windows]
+            continue
+        forecasts, seconds = result
+        cpu += seconds
+        rows += [(name, origin, forecast) for origin, forecast in zip(windows, forecasts)]
+    return rows, cpu
+
+
+def backtest(series_by_name, horizon=1, min_train=8, methods=METHODS, max_workers=None,
+             warm_start=True):
+    """Rolling-origin forecasts of every method.
+
+    Returns (windows, timing). `windows` is a DataFrame with one row per
+    method, series, origin and step (forecast, actual, error); `timing`
+    maps each method to (wall seconds, CPU seconds spent fitting).
+    Raises ValueError if there is no method, or if min_train is below
+    MIN_TRAIN or leaves no window to score.
+    """
+    import pandas as pd
+
+    series_by_name = {name: np.asarray(v, dtype=float) for name, v in series_by_name.items()}
+    longest = max((len(v) for v in series_by_name.values()), default=0)
+    if not methods:
+        raise ValueError("no methods to backtest")
+    if min_train < MIN_TRAIN:
+        raise ValueError(f"min_train={min_train} is below {MIN_TRAIN}: every fit needs "
+                         f"{MIN_TRAIN} points of history")
+    if min_train >= longest:
+        raise ValueError(f"min_train={min_train} leaves no window to score: "
+                         f"the longest series has {longest} points")
+    runners = {"last": run_last, "fast": run_fast, "arima": run_arima}
+
+    frames, timing = [], {}
+    for method in methods:
+        kwargs = {"max_workers": max_workers, "warm_start": warm_start} if method == "arima" else {}
+        t = time.perf_counter()
+        rows, cpu = runners[method](series_by_name, horizon, min_train, **kwargs)
+        timing[method] = (time.perf_counter() - t, cpu)
+
+        for name, origin, forecast in rows:
+            actual = _actuals(series_by_name[name], origin, horizon)
+            frames.append(pd.DataFrame({
+                "method": method, "series": name, "origin": origin,
+                "step": np.arange(1, horizon + 1), "forecast": forecast, "actual": actual,
+            }))
+    windows = pd.concat(frames, ignore_index=True).dropna(subset=["actual"])
+    windows["error"] = windows["forecast"] - windows["actual"]
+    return windows, timing
+
+
+def summarize(windows, by=("method",)):
+    """MAE, RMSE, MAPE (%) and scored/failed window counts per group."""
+    import pandas as pd
+
+    def metrics(g):
+        err = g["error"].dropna()
+        actual = g.loc[err.index, "actual"]
+        nonzero = actual != 0
+        return {
+            "MAE": err.abs().mean(),
+            "RMSE": np.sqrt((err ** 2).mean()),
+            "MAPE": (err[nonzero] / actual[nonzero]).abs().mean() * 100,
+            "scored": len(err),
+            "failed": len(g) - len(err),
+        }
+
+    groups = windows.groupby(list(by) if len(by) > 1 else by[0])
+    summary = pd.DataFrame({key: metrics(g) for key, g in groups}).T.rename_axis(list(by))
+    return summary.astype({"scored": int, "failed": int})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rolling-origin backtest of the inflation forecasts.")
+    parser.add_argument("--dataset", default="world_inflation", help="dataset under data/ (default: %(default)s)")
+    parser.add_argument("--columns", help="comma-separated series to test (default: all but Year)")
+    parser.add_argument("--horizon", type=int, default=1, help="steps ahead to score (default: %(default)s)")
+    parser.add_argument("--min-train", type=int, default=8, help="shortest training window (default: %(default)s)")
+    parser.add_argument("--methods", default=",".join(METHODS), help="comma-separated, from: " + ", ".join(METHODS))
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes for ARIMA")
+    parser.add_argument("--cold-start", action="store_true",
+                        help="fit every ARIMA window from scratch instead of the previous window's parameters")
+    parser.add_argument("--per-series", action="store_true", help="also break the metrics down by series")
+    parser.add_argument("-o", "--output", help="CSV file for the per-window forecasts and errors")
+    args = parser.parse_args(argv)
+
+    frame = datasets.load(args.dataset).to_frame()
+    columns = args.columns.split(",") if args.columns else [c for c in frame.columns if c != "Year"]
+    missing = [c for c in columns if c not in frame.columns]
+    if missing:
+        parser.error(f"unknown column(s) in {args.dataset}: {', '.join(missing)} "
+                     f"(available: {', '.join(c for c in frame.columns if c != 'Year')})")
+    methods = [m for m in args.methods.split(",") if m]
+    unknown = set(methods) - set(METHODS)
+    if unknown:
+        parser.error(f"unknown method(s): {', '.join(sorted(unknown))}")
+    if not methods:
+        parser.error("--methods is empty")
+    if args.min_train < MIN_TRAIN:
+        parser.error(f"--min-train must be at least {MIN_TRAIN}")
+    if args.min_train >= len(frame):
+        parser.error(f"--min-train {args.min_train} leaves no window to score: "
+                     f"{args.dataset} has {len(frame)} rows")
+
+    windows, timing = backtest({c: frame[c] for c in columns}, args.horizon, args.min_train,
+                               methods, args.jobs, warm_start=not args.cold_start)
+    summary = summarize(windows)
+    summary["wall s"] = [timing[m][0] for m in summary.index]
+    summary["fit CPU s"] = [timing[m][1] for m in summary.index]
+    print(summary.to_string(float_format=lambda x: f"{x:.3f}"))
+    if args.per_series:
+        print()
+        print(summarize(windows, by=("method", "series")).to_string(float_format=lambda x: f"{x:.3f}"))
+    if args.output:
+        windows.to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
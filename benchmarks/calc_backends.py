@@ -0,0 +1,88 @@
+"""Float vs Decimal vs Fraction backends of calc_engine.safe_eval.
+
+    python benchmarks/calc_backends.py --precision 28 50
+
+Speed: evaluations per second over the benchmark suite's keypad
+expressions, warm (compiled program cached) and cold (caches cleared), per
+backend and decimal precision.
+
+Accuracy: chained interest computations where binary floats drift: the
+float and 28-digit decimal results and their distance from the exact
+(fraction) value.
+"""
+import argparse
+import os
+import sys
+import time
+from decimal import Decimal
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calc_engine  # noqa: E402
+from run import EXPRESSIONS  # noqa: E402
+
+# (label, expression); rates and amounts as typed by a finance user
+FINANCE = [
+    ("ten payments of 0.1", "+".join(["0.1"] * 10)),
+    ("monthly compounding, 30y", "1000*(1+0.075/12)^360"),
+    ("EMI 25 lakh, 8.5%, 240m", "2500000*(0.085/12)*(1+0.085/12)^240/((1+0.085/12)^240-1)"),
+    ("daily interest, 1 year", "10000*(1+0.0365/365)^365-10000"),
+    ("0.1*3 - 0.3", "0.1*3-0.3"),
+]
+
+
+def rate(fn, items, min_time):
+    fn()
+    calls, start = 0, time.perf_counter()
+    while calls < 3 or time.perf_counter() - start < min_time:
+        fn()
+        calls += 1
+    return items * calls / (time.perf_counter() - start)
+
+
+def speed(precisions, min_time):
+    configs = [("float", None)] + [(b, p) for b in ("decimal", "fraction") for p in precisions]
+    print(f"{'backend':<20}{'warm evals/s':>14}{'cold evals/s':>14}{'vs float':>10}")
+    base = None
+    for backend, precision in configs:
+        kwargs = {} if precision is None else {"backend": backend, "precision": precision}
+
+        def warm():
+            return [calc_engine.safe_eval(e, "DEG", **kwargs) for e in EXPRESSIONS]
+
+        def cold():
+            calc_engine.compile_expr.cache_clear()
+            calc_engine.subexpr_memo.clear()
+            return warm()
+
+        w = rate(warm, len(EXPRESSIONS), min_time)
+        c = rate(cold, len(EXPRESSIONS), min_time)
+        base = base or w
+        label = backend if precision is None else f"{backend} ({precision})"
+        print(f"{label:<20}{w:>14,.0f}{c:>14,.0f}{w / base:>9.2f}x")
+
+
+def accuracy():
+    print(f"\n{'computation':<28}{'float':>22}{'exact (fraction)':>32}{'float err':>11}{'decimal(28) err':>17}")
+    for label, expr in FINANCE:
+        f = calc_engine.safe_eval(expr, "DEG")
+        d = calc_engine.safe_eval(expr, "DEG", backend="decimal", precision=28)
+        exact = calc_engine.safe_eval(expr, "DEG", backend="fraction")
+        shown = calc_engine.format_result(Decimal(exact.numerator) / exact.denominator)
+        print(f"{label:<28}{f!r:>22}{shown[:30]:>32}"
+              f"{float(abs(Fraction(f) - exact)):>11.1e}{float(abs(Fraction(d) - exact)):>17.1e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the calculator's numeric backends.")
+    parser.add_argument("--precision", type=int, nargs="+", default=[28, 50],
+                        help="decimal digits to test (default: %(default)s)")
+    parser.add_argument("--min-time", type=float, default=0.3, help="seconds per measurement (default: %(default)s)")
+    args = parser.parse_args(argv)
+    speed(args.precision, args.min_time)
+    accuracy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Fast NumPy forecaster vs statsmodels ARIMA(1,1,1): speed and accuracy.
+
+Speed: fitting ARIMA(1,1,1) one series at a time with statsmodels (the old
+dashboard path) against one fast_forecast.fit_batch() call, plus the fast
+full order search, on synthetic 15-point annual series.
+
+Accuracy: one-step-ahead holdout on the same kind of series (last point
+held out) and on data/world_inflation.csv, reporting the MAE of each
+method and how far the fast ARIMA(1,1,1) forecasts are from statsmodels'.
+
+    python benchmarks/fast_forecast.py --series 2000 --statsmodels-series 100
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fast_forecast import fit_batch, forecast_batch  # noqa: E402
+
+
+def synthetic(n_series, length=16, seed=0):
+    """Inflation-like ARIMA(1,1,1) paths around 2-8%."""
+    rng = np.random.default_rng(seed)
+    phi = rng.uniform(-0.5, 0.7, (n_series, 1))
+    theta = rng.uniform(-0.5, 0.5, (n_series, 1))
+    shocks = rng.normal(0, 0.8, (n_series, length + 1))
+    diffs = np.zeros((n_series, length))
+    for t in range(1, length):
+        diffs[:, t] = phi[:, 0] * diffs[:, t - 1] + shocks[:, t] + theta[:, 0] * shocks[:, t - 1]
+    return rng.uniform(2, 8, (n_series, 1)) + np.cumsum(diffs, axis=1)
+
+
+def statsmodels_forecasts(Y, order=(1, 1, 1)):
+    from statsmodels.tsa.arima.model import ARIMA
+
+    out = np.empty(len(Y))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i, values in enumerate(Y):
+            out[i] = np.asarray(ARIMA(values, order=order).fit().forecast(1))[0]
+    return out
+
+
+def timed(fn, *args):
+    t = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=2000, help="series for the fast path")
+    parser.add_argument("--statsmodels-series", type=int, default=100,
+                        help="series for statsmodels (slow; per-series time is extrapolated)")
+    args = parser.parse_args()
+
+    Y = synthetic(args.series)
+    train, actual = Y[:, :-1], Y[:, -1]
+    m = min(args.statsmodels_series, args.series)
+
+    t = time.perf_counter()
+    import statsmodels.tsa.arima.model  # noqa: F401
+    import_s = time.perf_counter() - t
+
+    sm, sm_s = timed(statsmodels_forecasts, train[:m])
+    (_, fast), fast_s = timed(fit_batch, train, (1, 1, 1), 1)
+    (search, _, _), search_s = timed(forecast_batch, train, 1)
+
+    print(f"{'speed (15-point series)':<34}{'total':>10}{'per series':>14}")
+    print(f"{'import statsmodels ARIMA':<34}{import_s:>9.2f}s")
+    print(f"{f'statsmodels ARIMA(1,1,1) x{m}':<34}{sm_s:>9.2f}s{sm_s / m * 1e3:>11.3f} ms")
+    print(f"{f'fast ARIMA(1,1,1) x{args.series}':<34}{fast_s:>9.3f}s{fast_s / args.series * 1e3:>11.4f} ms")
+    print(f"{f'fast 12-order search x{args.series}':<34}{search_s:>9.3f}s"
+          f"{search_s / args.series * 1e3:>11.4f} ms")
+    print(f"speed-up ARIMA(1,1,1), per series: {(sm_s / m) / (fast_s / args.series):,.0f}x")
+
+    print(f"\naccuracy, one-step holdout on {m} synthetic series (MAE, pp):")
+    last = train[:m, -1]
+    for name, forecast in (("last value", last), ("statsmodels ARIMA(1,1,1)", sm),
+                           ("fast ARIMA(1,1,1)", fast[:m, 0]), ("fast order search", search[:m, 0])):
+        print(f"  {name:<26}{np.mean(np.abs(forecast - actual[:m])):.3f}")
+    print(f"  |fast - statsmodels| ARIMA(1,1,1): mean {np.mean(np.abs(fast[:m, 0] - sm)):.3f}, "
+          f"median {np.median(np.abs(fast[:m, 0] - sm)):.3f}")
+
+    import datasets
+
+    frame = datasets.load("world_inflation").to_frame()
+    W = frame.drop(columns="Year").to_numpy().T
+    sm_w = statsmodels_forecasts(W[:, :-1])
+    fast_w = fit_batch(W[:, :-1], (1, 1, 1), 1)[1][:, 0]
+    search_w = forecast_batch(W[:, :-1], 1)[0][:, 0]
+    print(f"\nworld_inflation.csv, forecast of {int(frame['Year'].iloc[-1])} from earlier years:")
+    for i, name in enumerate(frame.columns[1:]):
+        print(f"  {name:<8} actual {W[i, -1]:5.2f}  statsmodels {sm_w[i]:5.2f}"
+              f"  fast {fast_w[i]:5.2f}  search {search_w[i]:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
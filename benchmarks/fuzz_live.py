@@ -0,0 +1,104 @@
+"""Fuzz calc_live's live preview against the AST evaluator.
+
+    python benchmarks/fuzz_live.py --cases 20000 --seed 1
+
+Random keypad sequences (the keys of calculator newb.py, doubled * and /
+included) are pushed into a LiveExpression one key at a time. Two checks:
+  complete    balanced input: preview() must equal calc_engine.safe_eval,
+              or be None exactly when safe_eval fails
+  autoclosed  any input with a preview: it must equal safe_eval of the
+              input with its open parentheses closed
+
+Exits 1 on the first few mismatches, printing them.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calc_engine  # noqa: E402
+from calc_engine import safe_eval  # noqa: E402
+from calc_live import LiveExpression  # noqa: E402
+
+KEYS = ["sin(", "cos(", "tan(", "sqrt(", "asin(", "acos(", "atan(", "ln(", "log(",
+        "7", "8", "9", "/", "4", "5", "6", "*", "1", "2", "3", "-", "0", ".", "π", "+",
+        "^", "(", ")", "!"]
+
+
+def typed(rng):
+    return [rng.choice(KEYS) for _ in range(rng.randint(1, 14))]
+
+
+def preview(keys, mode):
+    live = LiveExpression(mode)
+    for key in keys:
+        live.push(key)
+    return live.preview()
+
+
+def reference(expr, mode):
+    try:
+        value = safe_eval(expr, mode)
+    except Exception:
+        return None
+    if type(value) is int and value.bit_length() > calc_engine.MAX_DIGITS / math.log10(2):
+        return None  # past the preview's integer cap
+    return value
+
+
+def same(a, b):
+    if a is None or b is None:
+        return a is None and b is None
+    return a == b or math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def complete(rng, cases):
+    failures = []
+    for _ in range(cases):
+        keys, mode = typed(rng), rng.choice(["DEG", "RAD"])
+        expr = "".join(keys)
+        if expr.count("(") != expr.count(")"):
+            continue
+        ours, ref = preview(keys, mode), reference(expr, mode)
+        if not same(ours, ref):
+            failures.append(f"{expr!r} ({mode}): preview {ours!r}, ast {ref!r}")
+    return failures
+
+
+def autoclosed(rng, cases):
+    failures = []
+    for _ in range(cases):
+        keys, mode = typed(rng), rng.choice(["DEG", "RAD"])
+        ours = preview(keys, mode)
+        if ours is None:
+            continue
+        expr = "".join(keys)
+        closed = expr + ")" * (expr.count("(") - expr.count(")"))
+        ref = reference(closed, mode)
+        if not same(ours, ref):
+            failures.append(f"{expr!r} ({mode}): preview {ours!r}, ast of {closed!r} {ref!r}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fuzz the calculator's live preview.")
+    parser.add_argument("--cases", type=int, default=20000, help="key sequences per check (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    failures = []
+    for name, check in (("complete", complete), ("autoclosed", autoclosed)):
+        found = check(rng, args.cases)
+        print(f"{name}: {args.cases} sequences, {len(found)} failures")
+        failures += found
+    for failure in failures[:20]:
+        print("FAIL", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
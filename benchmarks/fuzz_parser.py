@@ -0,0 +1,169 @@
+"""Fuzz expr_parser against the AST evaluator.
+
+    python benchmarks/fuzz_parser.py --cases 20000 --seed 1
+
+Four checks:
+  differential  random well-formed expressions must give the same value
+                (or both fail) in expr_parser.evaluate and calc_engine.safe_eval
+  garbage       random strings over the calculator's alphabet may only raise
+                SyntaxError/NameError from parse(), never crash it
+  regressions   inputs the old str.replace chain got wrong (`1e5`, `3e`,
+                `2π`, `log(1e3)`) must give the right answer
+  multiline     safe_eval in every backend must give the same value with
+                newlines inside the brackets (MULTILINE, then random ones)
+
+Exits 1 on the first few mismatches, printing them.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calc_engine import BACKENDS, replace_eval, safe_eval  # noqa: E402
+from expr_parser import evaluate, parse  # noqa: E402
+
+# no log: ercl's log() is the natural log, safe_eval's is log10
+FUNCTIONS = ["sin", "cos", "tan", "sqrt", "abs", "ln", "atan"]
+ATOMS = ["pi", "e", "π"]
+ALPHABET = list("0123456789.+-*/^%!(),eπ√ ") + ["sin(", "cos(", "**", "//", "pi", "sec", "ln("]
+
+# (expression, mode, expected value); replace_eval gets every one wrong.
+# log() is the natural log in both; the chain turned 1e3 into 12.718...3.
+REGRESSIONS = [
+    ("1e5", "DEG", 1e5),
+    ("2.5e-3*4", "DEG", 0.01),
+    ("2π", "RAD", 2 * math.pi),
+    ("3e", "RAD", 3 * math.e),
+    ("sin(90)*e", "DEG", math.e),
+    ("√(16)+√9", "DEG", 7.0),
+    ("log(1e3)", "RAD", math.log(1e3)),
+]
+
+
+# (expression, backend, expected value); literal text and the subexpression
+# memo once came from the wrong columns past the first line
+MULTILINE = [
+    ("(sin(30)\n+sin(60))", "float", 0.5 + math.sqrt(3) / 2),
+    ("(1\n+2)", "decimal", 3),
+    ("(10\n+0.25)", "decimal", 10.25),
+    ("(10\n+0.25)", "fraction", 10.25),
+]
+
+
+def expression(rng, depth=0):
+    """A random well-formed expression both engines accept."""
+    if depth > 4 or rng.random() < 0.3:
+        roll = rng.random()
+        if roll < 0.5:
+            return str(rng.randint(0, 99))
+        if roll < 0.7:
+            return f"{rng.uniform(0, 100):.{rng.randint(1, 4)}f}"
+        if roll < 0.8:
+            return f"{rng.randint(1, 9)}e{rng.randint(-3, 3)}"
+        return rng.choice(ATOMS)
+    roll = rng.random()
+    if roll < 0.45:
+        op = rng.choice(["+", "-", "*", "/", "%", "//"])
+        return f"{expression(rng, depth + 1)}{op}{expression(rng, depth + 1)}"
+    if roll < 0.55:
+        # keep powers small so no case runs for seconds
+        return f"{expression(rng, depth + 1)}{rng.choice(['^', '**'])}{rng.randint(-3, 3)}"
+    if roll < 0.65:
+        return f"-{expression(rng, depth + 1)}"
+    if roll < 0.8:
+        return f"({expression(rng, depth + 1)})"
+    if roll < 0.85:
+        return f"{rng.randint(0, 12)}!"
+    return f"{rng.choice(FUNCTIONS)}({expression(rng, depth + 1)})"
+
+
+def outcome(fn, expr, mode):
+    try:
+        return fn(expr, mode)
+    except Exception as e:
+        return e
+
+
+def same(a, b):
+    if isinstance(a, Exception) or isinstance(b, Exception):
+        return isinstance(a, Exception) and isinstance(b, Exception)
+    if isinstance(a, complex) or isinstance(b, complex):
+        return a == b or abs(a - b) <= 1e-9 * max(abs(a), abs(b))
+    if math.isnan(a) and math.isnan(b):
+        return True
+    return a == b or math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def differential(rng, cases):
+    failures = []
+    for _ in range(cases):
+        expr, mode = expression(rng), rng.choice(["DEG", "RAD"])
+        ours, reference = outcome(evaluate, expr, mode), outcome(safe_eval, expr, mode)
+        if not same(ours, reference):
+            failures.append(f"{expr!r} ({mode}): parser {ours!r}, ast {reference!r}")
+    return failures
+
+
+def garbage(rng, cases):
+    failures = []
+    for _ in range(cases):
+        expr = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 30)))
+        try:
+            parse(expr, "DEG")
+        except (SyntaxError, NameError):
+            pass
+        except Exception as e:
+            failures.append(f"{expr!r}: parse raised {type(e).__name__}: {e}")
+    return failures
+
+
+def regressions():
+    failures = []
+    for expr, mode, expected in REGRESSIONS:
+        ours, old = outcome(evaluate, expr, mode), outcome(replace_eval, expr, mode)
+        if not same(ours, expected):
+            failures.append(f"{expr!r} ({mode}): parser {ours!r}, expected {expected!r}")
+        print(f"  {expr:<14} parser {ours!r:<22} replace chain {old!r}")
+    return failures
+
+
+def multiline(rng, cases):
+    failures = []
+    for expr, backend, expected in MULTILINE:
+        ours = outcome(lambda e, m: safe_eval(e, m, backend), expr, "DEG")
+        if isinstance(ours, Exception) or not same(float(ours), expected):
+            failures.append(f"{expr!r} ({backend}): {ours!r}, expected {expected!r}")
+    for _ in range(cases // len(BACKENDS)):
+        expr, mode = expression(rng), rng.choice(["DEG", "RAD"])
+        split = "(" + expr.replace("+", "\n+") + ")"
+        for backend in BACKENDS:
+            one = outcome(lambda e, m: safe_eval(e, m, backend), f"({expr})", mode)
+            many = outcome(lambda e, m: safe_eval(e, m, backend), split, mode)
+            if not (one == many or isinstance(one, Exception) and isinstance(many, Exception)):
+                failures.append(f"{split!r} ({mode}, {backend}): {many!r}, on one line {one!r}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fuzz the calculator expression parser.")
+    parser.add_argument("--cases", type=int, default=5000, help="expressions per check (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    print("regressions (old replace-chain results for comparison):")
+    failures = regressions()
+    for name, check in (("differential", differential), ("garbage", garbage), ("multiline", multiline)):
+        found = check(rng, args.cases)
+        print(f"{name}: {args.cases} cases, {len(found)} failures")
+        failures += found
+    for failure in failures[:20]:
+        print("FAIL", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""expr_parser vs the old str.replace chain on long expressions: where each wins.
+
+    python benchmarks/parser_speed.py --terms 10 100 1000 10000
+
+Each expression is `--terms` arithmetic terms joined by "+" (RAD mode,
+no trig: the replace chain can't evaluate sin/cos/√ at all). Columns:
+
+    replace       calc_engine.replace_eval: rewrite + Python eval every call
+    ast cold      calc_engine.safe_eval with its caches cleared
+    parser cold   expr_parser.evaluate with its cache cleared (tokenize + parse + run)
+    parser warm   expr_parser.evaluate on a cached program (run only)
+
+Times are per evaluation; "us/char" of the cold parser should stay flat as
+the input grows. The two ratio columns are replace time / parser time.
+
+What it shows: a one-off (cold) parse in Python runs about even with the
+replace chain, whose eval() hands the parsing to CPython's C compiler
+(0.8-1.3x across runs here); it does not beat the chain. A cached (warm)
+program runs 3-9x faster than the chain. Past a few thousand terms
+Python's own parser gives up (RecursionError, shown as "fails") and only
+expr_parser still evaluates.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calc_engine  # noqa: E402
+import expr_parser  # noqa: E402
+
+TERMS = ["12.5*3", "4/2", "7^2", "(1+2)*3", "π/4", "100%7", "8-3"]
+
+
+def long_expression(terms):
+    return "+".join(TERMS[i % len(TERMS)] for i in range(terms))
+
+
+def timed(fn, min_time=0.3):
+    """Mean seconds per call over at least min_time seconds."""
+    try:
+        fn()
+    except RecursionError:
+        return None
+    calls, start = 0, time.perf_counter()
+    while calls < 3 or time.perf_counter() - start < min_time:
+        fn()
+        calls += 1
+    return (time.perf_counter() - start) / calls
+
+
+def cold(fn, *clears):
+    def run():
+        for clear in clears:
+            clear()
+        return fn()
+    return run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the calculator parser on long expressions.")
+    parser.add_argument("--terms", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--min-time", type=float, default=0.3, help="seconds per measurement (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    columns = ["replace", "ast cold", "parser cold", "parser warm"]
+    print(f"{'terms':>7}{'chars':>9}" + "".join(f"{c:>14}" for c in columns)
+          + f"{'us/char':>10}{'vs cold':>10}{'vs warm':>10}")
+    for terms in args.terms:
+        expr = long_expression(terms)
+        runs = {
+            "replace": lambda: calc_engine.replace_eval(expr, "RAD"),
+            "ast cold": cold(lambda: calc_engine.safe_eval(expr, "RAD"),
+                             calc_engine.compile_expr.cache_clear, calc_engine.subexpr_memo.clear),
+            "parser cold": cold(lambda: expr_parser.evaluate(expr, "RAD"), expr_parser.parse.cache_clear),
+            "parser warm": lambda: expr_parser.evaluate(expr, "RAD"),
+        }
+        seconds = {name: timed(fn, args.min_time) for name, fn in runs.items()}
+        cells = "".join(f"{s * 1e3:>11.3f} ms" if s is not None else f"{'fails':>14}" for s in seconds.values())
+        per_char = seconds["parser cold"] / len(expr) * 1e6
+        ratios = "".join(
+            f"{seconds['replace'] / seconds[name]:>9.1f}x" if seconds["replace"] is not None else f"{'-':>10}"
+            for name in ("parser cold", "parser warm")
+        )
+        print(f"{terms:>7}{len(expr):>9}{cells}{per_char:>10.3f}{ratios}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Headless per-page rerun profile, drawn as text flame charts.
+
+    python benchmarks/profile_pages.py --reruns 10
+    python benchmarks/profile_pages.py --folded profiles/ --history profile_history.jsonl
+
+Drives every sidebar page of ameya.py through Streamlit's AppTest with
+profiling on. Each page is opened once (cold: caches and shared figures
+get filled) and then rerun --reruns times (warm). The report shows the
+named sections (profiling.section) under each page; "other" is the rest
+of the rerun: Streamlit itself plus code outside any section.
+
+--folded writes folded-stack files (<page>.cold.folded / <page>.warm.folded)
+for flamegraph.pl or speedscope. --history appends one JSON line per page,
+so rerun latency can be tracked over time.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import profiling  # noqa: E402
+
+
+def calculate_emi(at):
+    at.button[0].click().run()
+
+
+# (label, page script, optional action run once after opening the page)
+PAGES = [
+    ("Home", "app.py", None),
+    ("RISCO Meter", "pages/1_RISCO_Meter.py", None),
+    ("Interest Rate Calculator", "pages/2_Interest_Rate_Calculator.py", calculate_emi),
+    ("USA CPI Dashboard", "pages/3_USA_CPI_Dashboard.py", None),
+    ("World Inflation Dashboard", "pages/4_World_Inflation_Dashboard.py", None),
+]
+
+
+def timed_run(at, step):
+    """Run step(at) and return {path: seconds} for it, "other" included."""
+    profiling.take()
+    start = time.perf_counter()
+    step(at)
+    wall = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"page raised: {at.exception[0].message}")
+    by_path = profiling.totals(profiling.take(), root=("rerun",))
+    sectioned = sum(s for p, s in by_path.items() if len(p) == 2)
+    by_path[("rerun",)] = wall
+    by_path[("rerun", "other")] = max(wall - sectioned, 0.0)
+    return by_path
+
+
+def median_profile(profiles):
+    """Per-path median over several runs (missing paths count as 0)."""
+    paths = set().union(*profiles)
+    return {p: statistics.median(prof.get(p, 0.0) for prof in profiles) for p in paths}
+
+
+def profile_page(at, page, action, reruns):
+    def open_page(at):
+        at.switch_page(page).run()
+        if action:
+            action(at)
+
+    cold = timed_run(at, open_page)
+    warm = [timed_run(at, lambda at: at.run()) for _ in range(reruns)]
+    return cold, median_profile(warm)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile every dashboard page rerun headlessly.")
+    parser.add_argument("--reruns", type=int, default=5, help="warm reruns per page (default: %(default)s)")
+    parser.add_argument("--page", action="append", help="only pages whose label contains this (repeatable)")
+    parser.add_argument("--folded", metavar="DIR", help="write folded-stack files here")
+    parser.add_argument("--history", metavar="JSONL", help="append one summary line per page")
+    args = parser.parse_args(argv)
+
+    from streamlit.testing.v1 import AppTest
+
+    profiling.enable()
+    at = AppTest.from_file(os.path.join(ROOT, "ameya.py"), default_timeout=120).run()
+
+    for label, page, action in PAGES:
+        if args.page and not any(p.lower() in label.lower() for p in args.page):
+            continue
+        cold, warm = profile_page(at, page, action, args.reruns)
+
+        print(f"\n=== {label} ({page})")
+        print(f"--- cold (first open{' + action' if action else ''})")
+        print(profiling.tree(cold))
+        print(f"--- warm (median of {args.reruns} reruns)")
+        print(profiling.tree(warm))
+
+        slug = os.path.splitext(os.path.basename(page))[0]
+        if args.folded:
+            os.makedirs(args.folded, exist_ok=True)
+            for kind, profile in (("cold", cold), ("warm", warm)):
+                with open(os.path.join(args.folded, f"{slug}.{kind}.folded"), "w") as f:
+                    f.write(profiling.folded(profile) + "\n")
+        if args.history:
+            with open(args.history, "a") as f:
+                f.write(json.dumps({
+                    "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "page": page,
+                    "cold_ms": cold[("rerun",)] * 1e3,
+                    "warm_ms": warm[("rerun",)] * 1e3,
+                    "warm_sections_ms": {"/".join(p[1:]): s * 1e3 for p, s in warm.items() if len(p) > 1},
+                }) + "\n")
+
+
+if __name__ == "__main__":
+    main()
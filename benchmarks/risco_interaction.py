@@ -0,0 +1,75 @@
+"""Time per RISCO Meter slider interaction, before and after the fragment.
+
+"before" rebuilds the gauge and pie figures from scratch on every
+interaction (the old full-page rerun); "after" patches the session's
+figures in place. Both include the JSON serialization st.plotly_chart
+does for each chart.
+
+    python benchmarks/risco_interaction.py --interactions 500
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from risco import allocation_figure, gauge_figure, update_allocation, update_gauge  # noqa: E402
+from risk_scoring import get_model  # noqa: E402
+
+MODEL = get_model("riscometer")
+
+
+def allocations(n, seed=0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        equity = rng.randint(0, 100)
+        debt = rng.randint(0, 100 - equity)
+        yield equity, debt, 100 - equity - debt
+
+
+def rebuild(equity, debt, gold, state):
+    score = MODEL.score([equity, debt, gold])
+    _, color = MODEL.category(score)
+    gauge = gauge_figure(score, color, MODEL)
+    pie = allocation_figure([equity, debt, gold], MODEL)
+    return gauge.to_json(), pie.to_json()
+
+
+def patch(equity, debt, gold, state):
+    score = MODEL.score([equity, debt, gold])
+    _, color = MODEL.category(score)
+    update_gauge(state["gauge"], score, color)
+    update_allocation(state["pie"], [equity, debt, gold])
+    return state["gauge"].to_json(), state["pie"].to_json()
+
+
+def measure(step, n):
+    state = {"gauge": gauge_figure(0, "green", MODEL), "pie": allocation_figure([40, 40, 20], MODEL)}
+    times = []
+    for equity, debt, gold in allocations(n):
+        t = time.perf_counter()
+        step(equity, debt, gold, state)
+        times.append(time.perf_counter() - t)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interactions", type=int, default=500)
+    args = parser.parse_args()
+
+    measure(rebuild, 20)  # warm up imports and plotly validators
+    before = measure(rebuild, args.interactions)
+    after = measure(patch, args.interactions)
+    for name, times in (("before (rebuild)", before), ("after (in place)", after)):
+        times_ms = sorted(t * 1000 for t in times)
+        p95 = times_ms[int(0.95 * (len(times_ms) - 1))]
+        print(f"{name:<18} median {statistics.median(times_ms):7.3f} ms   p95 {p95:7.3f} ms")
+    print(f"speed-up: {statistics.median(before) / statistics.median(after):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""Benchmark suite for the dashboard and calculator hot paths (no browser).
+
+    python benchmarks/run.py                        # run everything, print a table
+    python benchmarks/run.py --save baseline.json   # record a baseline
+    python benchmarks/run.py --compare baseline.json --threshold 0.25
+    python benchmarks/run.py -k calc -k risco       # only cases whose name contains these
+
+Each case is timed call by call for at least --min-time seconds, giving
+throughput (items per second) and latency percentiles; peak memory comes
+from a separate tracemalloc run so it doesn't skew the timings. With
+--compare, a case whose median latency or peak memory grew by more than
+--threshold is flagged and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+from importlib.util import find_spec
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calc_engine  # noqa: E402
+import datasets  # noqa: E402
+import expr_parser  # noqa: E402
+from amortization import amortize, portfolio_totals  # noqa: E402
+from fast_forecast import forecast_batch  # noqa: E402
+from risk_scoring import get_model  # noqa: E402
+
+# Expressions as typed on the calculators (DEG mode)
+EXPRESSIONS = [
+    "2+3*4", "sqrt(16)+5!", "sin(30)+cos(60)", "log(100)*ln(e)", "(1+2)*(3+4)/5",
+    "2**10-1", "pi*5**2", "tan(45)+asin(0.5)", "pow(2, 0.5)-sqrt(2)", "10!/(3!*7!)",
+]
+
+
+# -----------------------------------------------------------
+#                           CASES
+# -----------------------------------------------------------
+# Each case: name -> setup() returning (fn, items per call). setup() is
+# not timed, so inputs are built there.
+def case_emi_single():
+    return (lambda: amortize(2_500_000, 8.5, 240)), 1
+
+
+def case_emi_portfolio():
+    rng = np.random.default_rng(0)
+    n = 10_000
+    principal = rng.uniform(1e5, 5e6, n)
+    rate = rng.uniform(6, 14, n)
+    tenure = rng.choice([60, 120, 180, 240, 360], n)
+    return (lambda: portfolio_totals(principal, rate, tenure)), n
+
+
+def case_risco_single():
+    model = get_model("riscometer")
+    return (lambda: model.category(model.score([60, 30, 10]))), 1
+
+
+def case_risco_book():
+    model = get_model("riscometer")
+    rng = np.random.default_rng(0)
+    n = 100_000
+    alloc = rng.dirichlet(np.ones(len(model.assets)), n) * 100
+    return (lambda: model.category_counts(model.score_allocations(alloc)[1])), n
+
+
+def case_cpi_yoy():
+    cpi = np.asarray(datasets.load("usa_cpi").columns["CPI"], dtype=float)
+    return (lambda: datasets.yoy(cpi)), len(cpi)
+
+
+def case_cpi_yoy_monthly():
+    cpi = 100 * np.cumprod(1 + np.random.default_rng(0).normal(0.002, 0.003, 12 * 100))
+    return (lambda: datasets.yoy(cpi, periods=12)), len(cpi)
+
+
+def case_arima_statsmodels():
+    if find_spec("statsmodels") is None:
+        return None
+    from statsmodels.tsa.arima.model import ARIMA
+
+    values = np.asarray(datasets.load("world_inflation").columns["India"], dtype=float)
+
+    def fit():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return ARIMA(values, order=(1, 1, 1)).fit().forecast(1)
+    return fit, 1
+
+
+def case_forecast_fast():
+    Y = np.cumsum(np.random.default_rng(0).normal(size=(1000, 15)), axis=1) + 5
+    return (lambda: forecast_batch(Y, 1)), len(Y)
+
+
+def case_calc_preprocess():
+    return (lambda: [calc_engine.preprocess(e) for e in EXPRESSIONS]), len(EXPRESSIONS)
+
+
+def case_calc_safe_eval():
+    return (lambda: [calc_engine.safe_eval(e, "DEG") for e in EXPRESSIONS]), len(EXPRESSIONS)
+
+
+def case_calc_safe_eval_cold():
+    # compile cache cleared each call: parse + compile + evaluate
+    def run():
+        calc_engine.compile_expr.cache_clear()
+        calc_engine.subexpr_memo.clear()
+        return [calc_engine.safe_eval(e, "DEG") for e in EXPRESSIONS]
+    return run, len(EXPRESSIONS)
+
+
+def case_calc_incremental():
+    # "=" after each term typed: every prefix is a new string (compile cache
+    # cleared), but subexpr_memo still holds the calls and powers typed before
+    prefixes = ["+".join(EXPRESSIONS[:k]) for k in range(1, len(EXPRESSIONS) + 1)]
+
+    def run():
+        calc_engine.compile_expr.cache_clear()
+        return [calc_engine.safe_eval(e, "DEG", backend="decimal", precision=50) for e in prefixes]
+    return run, len(prefixes)
+
+
+def case_calc_safe_eval_decimal():
+    return (lambda: [calc_engine.safe_eval(e, "DEG", backend="decimal") for e in EXPRESSIONS]), len(EXPRESSIONS)
+
+
+def case_calc_safe_eval_fraction():
+    return (lambda: [calc_engine.safe_eval(e, "DEG", backend="fraction") for e in EXPRESSIONS]), len(EXPRESSIONS)
+
+
+def case_calc_live_typing():
+    # calculator newb.py's live preview: push one key, then preview, for
+    # every key of a ~2000-key expression (time per key must not grow with it)
+    import calc_live
+
+    keys = [k for i in range(500) for k in ("sin(", str(i % 90), ")", "+*-/"[i % 4])] + ["1"]
+
+    def run():
+        live = calc_live.LiveExpression("DEG")
+        for key in keys:
+            live.push(key)
+            live.preview()
+        return live.preview()
+    return run, len(keys)
+
+
+def case_calc_bounded_eval():
+    # safe_eval in calc_worker's process: pickling + pipe round trip per expression
+    import calc_worker
+
+    return (lambda: [calc_worker.bounded_eval(e, "DEG") for e in EXPRESSIONS]), len(EXPRESSIONS)
+
+
+def case_calc_pratt_eval():
+    return (lambda: [expr_parser.evaluate(e, "DEG") for e in EXPRESSIONS]), len(EXPRESSIONS)
+
+
+def case_calc_pratt_eval_cold():
+    # program cache cleared each call: tokenize + parse + run
+    def run():
+        expr_parser.parse.cache_clear()
+        return [expr_parser.evaluate(e, "DEG") for e in EXPRESSIONS]
+    return run, len(EXPRESSIONS)
+
+
+def case_calc_replace_eval():
+    def run():
+        out = []
+        for e in EXPRESSIONS:
+            try:
+                out.append(calc_engine.replace_eval(e, "DEG"))
+            except Exception:
+                out.append(None)  # ercl's rewrite chain rejects some inputs
+        return out
+    return run, len(EXPRESSIONS)
+
+
+CASES = {name[len("case_"):]: fn for name, fn in globals().items() if name.startswith("case_")}
+
+
+# -----------------------------------------------------------
+#                        MEASUREMENT
+# -----------------------------------------------------------
+def measure(fn, items, min_time=0.5, min_calls=5):
+    """Time fn() call by call; return the case's result record."""
+    fn()  # warm-up (imports, caches, lazy tables)
+    times = []
+    start = time.perf_counter()
+    while len(times) < min_calls or time.perf_counter() - start < min_time:
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ms = np.array(times) * 1e3
+    return {
+        "calls": len(times),
+        "items_per_call": items,
+        "throughput": items * len(times) / sum(times),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "mean_ms": statistics.fmean(ms),
+        "peak_kib": peak / 1024,
+    }
+
+
+def run(selected, min_time):
+    results = {}
+    for name, setup in CASES.items():
+        if selected and not any(k in name for k in selected):
+            continue
+        case = setup()
+        if case is None:
+            print(f"{name:<24} skipped (optional dependency missing)", file=sys.stderr)
+            continue
+        results[name] = measure(*case, min_time=min_time)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """[(case, metric, old, new, change)] for metrics that grew past threshold."""
+    regressions = []
+    for name, new in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        for metric in ("p50_ms", "peak_kib"):
+            if old[metric] > 0 and new[metric] > old[metric] * (1 + threshold):
+                regressions.append((name, metric, old[metric], new[metric], new[metric] / old[metric] - 1))
+    return regressions
+
+
+def report(results, baseline=None):
+    print(f"{'case':<24}{'items/s':>14}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak KiB':>11}"
+          + (f"{'p50 vs base':>13}" if baseline else ""))
+    for name, r in results.items():
+        line = (f"{name:<24}{r['throughput']:>14,.0f}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}"
+                f"{r['p99_ms']:>10.3f}{r['peak_kib']:>11,.1f}")
+        if baseline and name in baseline:
+            old = baseline[name]["p50_ms"]
+            # a p50 that rounded to 0 has no meaningful ratio
+            line += f"{r['p50_ms'] / old - 1:>+12.0%}" if old > 0 else f"{'n/a':>12}"
+        print(line)
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "cpus": os.cpu_count(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard and calculator hot paths.")
+    parser.add_argument("-k", dest="selected", action="append", default=[],
+                        help="only run cases whose name contains this (repeatable); "
+                             "cases: " + ", ".join(CASES))
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds per case (default: %(default)s)")
+    parser.add_argument("--save", metavar="JSON", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="JSON", help="baseline to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed growth in p50 latency / peak memory (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["cases"]
+
+    results = run(args.selected, args.min_time)
+    report(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"environment": environment(), "cases": results}, f, indent=2)
+        print(f"\nbaseline written to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for name, metric, old, new, change in regressions:
+            print(f"REGRESSION {name}: {metric} {old:,.3f} -> {new:,.3f} ({change:+.0%})")
+        if regressions:
+            return 1
+        print(f"\nno regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Cold-start import cost: old single-script dashboard vs per-page scripts.
+
+Each measurement runs in a fresh interpreter, so nothing is already in
+sys.modules. Run from anywhere:
+
+    python benchmarks/startup.py --repeat 5
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What ameya.py imported at the top before it was split into pages/
+SINGLE_SCRIPT = """
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+import plotly.express as px
+from statsmodels.tsa.arima.model import ARIMA
+"""
+
+PAGES = {
+    "Home": "app.py",
+    "RISCO Meter": "pages/1_RISCO_Meter.py",
+    "Interest Rate Calculator": "pages/2_Interest_Rate_Calculator.py",
+    "USA CPI Dashboard": "pages/3_USA_CPI_Dashboard.py",
+    "World Inflation Dashboard": "pages/4_World_Inflation_Dashboard.py",
+}
+
+
+def page_imports(path):
+    """Top-level import statements of a page script."""
+    with open(os.path.join(ROOT, path)) as f:
+        tree = ast.parse(f.read())
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(node) for node in imports)
+
+
+def cold_import_time(code, repeat):
+    """Median wall time (s) of running `code` in a fresh interpreter."""
+    timer = (
+        "import time\n"
+        "_t = time.perf_counter()\n"
+        f"{code}\n"
+        "print(time.perf_counter() - _t)\n"
+    )
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", timer], cwd=ROOT, check=True,
+            capture_output=True, text=True,
+        )
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement")
+    args = parser.parse_args()
+
+    baseline = cold_import_time(SINGLE_SCRIPT, args.repeat)
+    print(f"{'single script (every page)':<32} {baseline * 1000:8.1f} ms")
+    for name, path in PAGES.items():
+        t = cold_import_time(page_imports(path), args.repeat)
+        print(f"{name:<32} {t * 1000:8.1f} ms   ({baseline / t:4.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
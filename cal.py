@@ -1,12 +1,43 @@
+import streamlit as st
+
+from calc_engine import format_result
+from calc_worker import bounded_eval, start as start_worker
+from calc_live import LiveExpression
+
+# ---------------- Session state ----------------
+if "expr" not in st.session_state:
+    st.session_state.expr = ""
+if "memory" not in st.session_state:
+    st.session_state.memory = 0.0
+if "mode" not in st.session_state:
+    st.session_state.mode = "DEG"
+if "live" not in st.session_state:
+    st.session_state.live = None  # LiveExpression of expr, built on first use
+
+# start the evaluation worker while the user is still typing
+start_worker()
+
+def live_expr():
+    """The session's LiveExpression, rebuilt if expr or the mode changed under it."""
+    live = st.session_state.live
+    if live is None or live.mode != st.session_state.mode or live.length != len(st.session_state.expr):
+        live = st.session_state.live = LiveExpression(st.session_state.mode)
+        live.push(st.session_state.expr)
+    return live
+
+def append_token(tok: str):
+    live = live_expr()
+    st.session_state.expr += tok
+    live.push(tok)  # O(token): only the new key is parsed
 
-   
 def clear():
     st.session_state.expr = ""
+    st.session_state.live = None
 
 def evaluate_expression():
     try:
-        # safe evaluation
-        val = safe_eval(st.session_state.expr, st.session_state.mode)
+        # safe evaluation in the worker process, killed if it runs too long
+        val = bounded_eval(st.session_state.expr, st.session_state.mode)
         # format result nicely: if integer-like, show as int
         if isinstance(val, float) and val.is_integer():
             st.session_state.expr = str(int(val))
@@ -14,12 +45,16 @@ def evaluate_expression():
             st.session_state.expr = str(val)
     except Exception as e:
         st.session_state.expr = "Error"
+    st.session_state.live = None
 
 # ---------------- UI ----------------
 st.markdown("<div class='calc-container'>", unsafe_allow_html=True)
 st.markdown("<div class='title'>CASIO fx-991 (Streamlit Edition)</div>", unsafe_allow_html=True)
 st.markdown(f"<div class='mode'>Mode: <strong>{st.session_state.mode}</strong>  &nbsp; | &nbsp; Memory: <strong>{st.session_state.memory}</strong></div>", unsafe_allow_html=True)
 st.markdown(f"<div class='display' id='display'>{st.session_state.expr}</div>", unsafe_allow_html=True)
+preview = live_expr().preview()  # result so far, while typing
+if preview is not None and format_result(preview) != st.session_state.expr:
+    st.markdown(f"<div class='mode'>= {format_result(preview)}</div>", unsafe_allow_html=True)
 
 # Buttons layout - list of rows
 buttons = [
@@ -60,13 +95,13 @@ for r_index, row in enumerate(buttons):
                 elif label == "M+":
                     # try to evaluate current expression into a number and add to memory
                     try:
-                        res = safe_eval(st.session_state.expr, st.session_state.mode)
+                        res = bounded_eval(st.session_state.expr, st.session_state.mode)
                         st.session_state.memory += float(res)
                     except Exception:
                         pass
                 elif label == "M-":
                     try:
-                        res = safe_eval(st.session_state.expr, st.session_state.mode)
+                        res = bounded_eval(st.session_state.expr, st.session_state.mode)
                         st.session_state.memory -= float(res)
                     except Exception:
                         pass
@@ -75,7 +110,7 @@ for r_index, row in enumerate(buttons):
                 elif label == "pi":
                     append_token("pi")
                 elif label == "!":
-                    # append '!' and let safe_eval convert patterns like 5! to factorial(5)
+                    # append "!" and let the evaluator convert patterns like 5! to factorial(5)
                     append_token("!")
                 else:
                     append_token(label)
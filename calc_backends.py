@@ -0,0 +1,279 @@
+"""Exact numeric backends for calc_engine: Decimal and Fraction.
+
+    safe_eval("1000*(1+0.1/12)^12", "DEG", backend="decimal", precision=40)
+    safe_eval("1/3+1/6", "DEG", backend="fraction")     # Fraction(1, 2)
+
+decimal   every result is a decimal.Decimal rounded to `precision`
+          significant digits; literals are read from their source text,
+          so 0.1 is exactly one tenth.
+fraction  + - * / and integer powers are exact rationals. sqrt of a
+          perfect square is exact too; other functions (trig, logs,
+          fractional powers) and the constants pi and e are computed in
+          Decimal at `precision` digits and converted to a Fraction.
+
+Decimal has no trigonometry, so sin/cos/atan are evaluated here by Taylor
+series with a few guard digits; in DEG mode whole multiples of 90 degrees
+are exact (cos(90) is 0). With the decimal backend // and % truncate
+toward zero like Decimal itself (-7 // 2 is -3, not -4 as with floats).
+"""
+import math
+import operator
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from functools import lru_cache
+
+from calc_engine import check_digits, checked_pow, factorial_digits
+
+GUARD = 5  # extra digits carried inside the series, dropped on return
+
+
+# ---------------- Decimal functions ----------------
+@lru_cache(maxsize=None)
+def _pi(prec):
+    """pi to `prec` digits (the recipe from the decimal module docs)."""
+    with localcontext() as ctx:
+        ctx.prec = prec + GUARD
+        three = Decimal(3)
+        lasts, t, s, n, na, d, da = 0, three, 3, 1, 0, 0, 24
+        while s != lasts:
+            lasts = s
+            n, na = n + na, na + 8
+            d, da = d + da, da + 32
+            t = (t * n) / d
+            s += t
+    with localcontext() as ctx:
+        ctx.prec = prec
+        return +s
+
+
+def _sin_series(x, prec):
+    """sin(x) for |x| <= pi, computed at prec + GUARD digits."""
+    with localcontext() as ctx:
+        ctx.prec = prec + GUARD
+        x2, term, total, i = x * x, x, x, 1
+        while True:
+            term = -term * x2 / ((i + 1) * (i + 2))
+            i += 2
+            if total + term == total:
+                return total
+            total += term
+
+
+def _reduce(x, prec):
+    """x folded into [-pi, pi]."""
+    with localcontext() as ctx:
+        ctx.prec = prec + GUARD + max(0, x.adjusted())
+        two_pi = 2 * _pi(ctx.prec)
+        x = x % two_pi  # Decimal %: same sign as x
+        pi = two_pi / 2
+        if x > pi:
+            x -= two_pi
+        elif x < -pi:
+            x += two_pi
+        return x
+
+
+def _sin(x, prec):
+    return _sin_series(_reduce(x, prec), prec)
+
+
+def _cos(x, prec):
+    with localcontext() as ctx:
+        ctx.prec = prec + GUARD
+        x = _reduce(x, prec)
+        # cos(x) = sin(pi/2 - x), folded back into the series' range
+        y = _pi(prec + GUARD) / 2 - x
+        if y > _pi(prec + GUARD):
+            y -= 2 * _pi(prec + GUARD)
+        return _sin_series(y, prec)
+
+
+def _atan(x, prec):
+    with localcontext() as ctx:
+        ctx.prec = prec + GUARD
+        if x < 0:
+            return -_atan(-x, prec)
+        if x > 1:
+            return _pi(prec + GUARD) / 2 - _atan(1 / x, prec)
+        # atan(x) = 2 atan(x / (1 + sqrt(1 + x^2))), twice: |x| <= 0.2 for the series
+        for _ in range(2):
+            x = x / (1 + (1 + x * x).sqrt())
+        x2, term, total, i = x * x, x, x, 1
+        while True:
+            term = -term * x2
+            i += 2
+            step = term / i
+            if total + step == total:
+                return 4 * total
+            total += step
+
+
+def _asin(x, prec):
+    with localcontext() as ctx:
+        ctx.prec = prec + GUARD
+        if abs(x) > 1:
+            raise ValueError("math domain error")
+        if abs(x) == 1:
+            return x * _pi(prec + GUARD) / 2
+        return _atan(x / (1 - x * x).sqrt(), prec)
+
+
+def _acos(x, prec):
+    with localcontext() as ctx:
+        ctx.prec = prec + GUARD
+        return _pi(prec + GUARD) / 2 - _asin(x, prec)
+
+
+def _factorial(x):
+    # sized before int(x): Decimal 1e999999 is a million-digit int already
+    check_digits(factorial_digits(x), "Factorial")
+    if x < 0 or x != int(x):
+        raise ValueError("factorial() only accepts non-negative integral values")
+    return type(x)(math.factorial(int(x)))
+
+
+# DEG mode: sin/cos of whole multiples of 90 degrees are exact
+_QUARTER_SIN = (0, 1, 0, -1)
+
+
+def _rounded(fn, prec):
+    """fn(x) rounded to `prec` digits on return."""
+    def call(x):
+        with localcontext() as ctx:
+            result = fn(x)
+            ctx.prec = prec
+            return +result
+    return call
+
+
+def decimal_names(mode, prec):
+    """make_names(mode) with Decimal arguments and results."""
+    pi = _pi(prec)
+
+    def to_rad(x):
+        with localcontext() as ctx:
+            ctx.prec = prec + GUARD + max(0, x.adjusted())
+            return x * _pi(ctx.prec) / 180
+
+    def from_rad(x):
+        with localcontext() as ctx:
+            ctx.prec = prec + GUARD
+            return x * 180 / _pi(prec + GUARD)
+
+    def turn(x):
+        """x mod 360, exactly: rounding x / 360 to `prec` digits would lose
+        every digit of the angle past 1e`prec` (sin(1e5000) came out 0)."""
+        if not x.is_finite():
+            return x
+        with localcontext() as ctx:
+            ctx.prec = max(ctx.prec, x.adjusted() + 3)  # the whole quotient
+            return x % 360
+
+    def quarter(x):
+        """x / 90 mod 4 when x (already reduced by turn) is a whole multiple of 90, else None."""
+        q = x / 90
+        return int(q) % 4 if q == q.to_integral_value() else None
+
+    if mode == "DEG":
+        def sin(x):
+            x = turn(x)
+            q = quarter(x)
+            return Decimal(_QUARTER_SIN[q]) if q is not None else _sin(to_rad(x), prec)
+
+        def cos(x):
+            x = turn(x)
+            q = quarter(x)
+            return Decimal(_QUARTER_SIN[(q + 1) % 4]) if q is not None else _cos(to_rad(x), prec)
+
+        def tan(x):
+            x = turn(x)
+            q = quarter(x)
+            if q in (1, 3):
+                raise ValueError("math domain error")
+            if q is not None:
+                return Decimal(0)
+            with localcontext() as ctx:
+                ctx.prec = prec + GUARD
+                return sin(x) / cos(x)
+
+        asin = lambda x: from_rad(_asin(x, prec))  # noqa: E731
+        acos = lambda x: from_rad(_acos(x, prec))  # noqa: E731
+        atan = lambda x: from_rad(_atan(x, prec))  # noqa: E731
+    else:  # RAD
+        sin = lambda x: _sin(x, prec)  # noqa: E731
+        cos = lambda x: _cos(x, prec)  # noqa: E731
+
+        def tan(x):
+            with localcontext() as ctx:
+                ctx.prec = prec + GUARD
+                return _sin(x, prec) / _cos(x, prec)
+
+        asin = lambda x: _asin(x, prec)  # noqa: E731
+        acos = lambda x: _acos(x, prec)  # noqa: E731
+        atan = lambda x: _atan(x, prec)  # noqa: E731
+
+    trig = {"sin": sin, "cos": cos, "tan": tan, "asin": asin, "acos": acos, "atan": atan}
+    with localcontext() as ctx:
+        ctx.prec = prec
+        e = Decimal(1).exp()
+    return {
+        **{name: _rounded(fn, prec) for name, fn in trig.items()},
+        "sqrt": _rounded(lambda x: x.sqrt(), prec),
+        "log": _rounded(lambda x: x.log10(), prec),
+        "ln": _rounded(lambda x: x.ln(), prec),
+        "factorial": _factorial,
+        "abs": abs,
+        "pow": checked_pow,
+        "pi": pi,
+        "e": e,
+    }
+
+
+# ---------------- Fraction functions ----------------
+def _to_decimal(x, prec):
+    with localcontext() as ctx:
+        ctx.prec = prec + GUARD
+        return Decimal(x.numerator) / Decimal(x.denominator)
+
+
+def _via_decimal(fn, prec):
+    """A Decimal function applied to Fractions (results converted exactly)."""
+    def call(*args):
+        with localcontext() as ctx:
+            ctx.prec = prec
+            return Fraction(fn(*[_to_decimal(a, prec) for a in args]))
+    return call
+
+
+def fraction_names(mode, prec):
+    """make_names(mode) with Fraction arguments and results."""
+    dec = decimal_names(mode, prec)
+    pow_inexact = _via_decimal(operator.pow, prec)
+
+    def sqrt(x):
+        if x >= 0:
+            num, den = math.isqrt(x.numerator), math.isqrt(x.denominator)
+            if num * num == x.numerator and den * den == x.denominator:
+                return Fraction(num, den)
+        return Fraction(dec["sqrt"](_to_decimal(x, prec)))
+
+    def power(base, exponent, mod=None):
+        if mod is not None:
+            if base.denominator == exponent.denominator == mod.denominator == 1:
+                return Fraction(pow(base.numerator, exponent.numerator, mod.numerator))
+            raise TypeError("pow() 3rd argument not allowed unless all arguments are integers")
+        if exponent.denominator == 1:
+            return checked_pow(base, exponent.numerator)
+        return pow_inexact(base, exponent)
+
+    names = {name: _via_decimal(dec[name], prec)
+             for name in ("sin", "cos", "tan", "asin", "acos", "atan", "log", "ln")}
+    names.update({
+        "sqrt": sqrt,
+        "factorial": _factorial,
+        "abs": abs,
+        "pow": power,
+        "pi": Fraction(dec["pi"]),
+        "e": Fraction(dec["e"]),
+    })
+    return names
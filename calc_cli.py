@@ -0,0 +1,95 @@
+"""Evaluate calculator expressions offline, one per line.
+
+    python calc_cli.py expressions.txt --engine ast --mode DEG --jobs 4
+    cat expressions.txt | python calc_cli.py - > results.tsv
+
+Each output line is "<expression>\t<result>" (or "Error: ..."), written
+in input order as soon as its chunk is done.
+"""
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from calc_engine import ENGINES, format_result
+
+
+def evaluate_chunk(lines, engine, mode):
+    """Evaluate a list of expressions; one output line per input line."""
+    evaluate = ENGINES[engine]
+    out = []
+    for line in lines:
+        expr = line.strip()
+        if not expr:
+            out.append("")
+            continue
+        try:
+            result = format_result(evaluate(expr, mode))
+        except Exception as e:
+            result = f"Error: {type(e).__name__}: {e}"
+        out.append(f"{expr}\t{result}")
+    return out
+
+
+def chunks(lines, size):
+    lines = iter(lines)
+    while chunk := list(islice(lines, size)):
+        yield chunk
+
+
+def evaluate_stream(lines, engine="ast", mode="DEG", jobs=None, chunk_size=1000):
+    """Yield output lines in input order, evaluating chunks in parallel.
+
+    At most 2 * jobs chunks are in flight, so memory stays bounded for
+    inputs of any length.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")  # chunks() would yield nothing
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for chunk in chunks(lines, chunk_size):
+            yield from evaluate_chunk(chunk, engine, mode)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for chunk in chunks(lines, chunk_size):
+            pending.append(executor.submit(evaluate_chunk, chunk, engine, mode))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate calculator expressions line by line.")
+    parser.add_argument("input", nargs="?", default="-", help="expression file ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="result file ('-' for stdout)")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="ast",
+                        help="ast: calculator newb.py, pratt: ercl.py, replace: ercl.py's old "
+                             "str.replace evaluator, basic: calculatorscientific.py")
+    parser.add_argument("--mode", choices=["DEG", "RAD"], default="DEG")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="expressions per work unit")
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for line in evaluate_stream(src, args.engine, args.mode, args.jobs, args.chunk_size):
+            dst.write(line + "\n")
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+
+if __name__ == "__main__":
+    main()
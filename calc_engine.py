@@ -0,0 +1,606 @@
+# Safe expression evaluator behind the Streamlit calculators.
+# Expressions are parsed once, checked against an allow-list of operators
+# and names, compiled into closures with constant subtrees folded, and
+# cached per (expression, mode).
+# Numbers are floats unless a Decimal or Fraction backend is asked for
+# (see calc_backends.py).
+import ast
+import math
+import numbers
+import operator
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+# Numeric backends; "float" is the fast default
+BACKENDS = ("float", "decimal", "fraction")
+DEFAULT_PRECISION = 28  # significant digits of the decimal backend
+
+# ---------------- Cost guard ----------------
+# Big-integer pow and factorial are sized before they run, so 9^9^9 or
+# 100000! fail at once instead of pinning a server core for minutes.
+# Python won't print an int over 4300 digits anyway (sys.set_int_max_str_digits).
+MAX_DIGITS = int(os.environ.get("RBI_CALC_MAX_DIGITS", 4300))
+_LOG10_2 = math.log10(2)
+
+
+def check_digits(digits, what):
+    if digits > MAX_DIGITS:
+        raise OverflowError(f"{what} too large: about {digits:,.0f} digits (limit {MAX_DIGITS:,})")
+
+
+def pow_digits(base, exp):
+    """Decimal digits of base ** exp for a rational base and int exponent."""
+    if base == 0:
+        return 1
+    size = max(math.log10(abs(base.numerator)), math.log10(base.denominator))
+    return abs(exp) * size
+
+
+def factorial_digits(n):
+    """Decimal digits of n! (inf when n is too big to even estimate)."""
+    return math.lgamma(float(n) + 1) / math.log(10) if n > 1 else 1
+
+
+def checked_pow(base, exp, mod=None):
+    """pow() that refuses exact results over MAX_DIGITS before computing them."""
+    # float powers are hardware ops and int ** -n gives a float: only exact
+    # (int or Fraction) results can grow without bound
+    if type(exp) is int and mod is None:
+        kind = type(base)
+        if kind is int:
+            # bit_length() over-estimates log2(base): a cheap first filter
+            if exp > 0 and base.bit_length() * exp * _LOG10_2 > MAX_DIGITS:
+                check_digits(pow_digits(base, exp), "Power")
+        elif kind is not float and isinstance(base, numbers.Rational):
+            check_digits(pow_digits(base, exp), "Power")
+        return base ** exp
+    return pow(base, exp, mod)
+
+
+def checked_factorial(n):
+    if type(n) is int and n > 170:  # 170! is about the size of the largest float
+        check_digits(factorial_digits(n), "Factorial")
+    return math.factorial(n)
+
+
+# Allowed binary/unary operators
+_ops = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: checked_pow,
+    ast.Mod: operator.mod,
+    ast.FloorDiv: operator.floordiv,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+def make_names(mode: str, backend: str = "float", precision: int = DEFAULT_PRECISION):
+    """Return allowed functions/constants based on DEG/RAD mode."""
+    if backend != "float":
+        return _exact_names(mode, backend, precision)
+    if mode == "DEG":
+        return {
+            "sin": lambda x: math.sin(math.radians(x)),
+            "cos": lambda x: math.cos(math.radians(x)),
+            "tan": lambda x: math.tan(math.radians(x)),
+            "asin": lambda x: math.degrees(math.asin(x)),
+            "acos": lambda x: math.degrees(math.acos(x)),
+            "atan": lambda x: math.degrees(math.atan(x)),
+            "sqrt": math.sqrt,
+            "log": lambda x: math.log10(x),
+            "ln": math.log,
+            "factorial": checked_factorial,
+            "abs": abs,
+            "pow": checked_pow,
+            "pi": math.pi,
+            "e": math.e,
+        }
+    else:  # RAD
+        return {
+            "sin": math.sin,
+            "cos": math.cos,
+            "tan": math.tan,
+            "asin": math.asin,
+            "acos": math.acos,
+            "atan": math.atan,
+            "sqrt": math.sqrt,
+            "log": lambda x: math.log10(x),
+            "ln": math.log,
+            "factorial": checked_factorial,
+            "abs": abs,
+            "pow": checked_pow,
+            "pi": math.pi,
+            "e": math.e,
+        }
+
+@lru_cache(maxsize=None)
+def _exact_names(mode, backend, precision):
+    from calc_backends import decimal_names, fraction_names
+
+    if backend == "decimal":
+        return decimal_names(mode, precision)
+    if backend == "fraction":
+        return fraction_names(mode, precision)
+    raise ValueError(f"Unknown numeric backend '{backend}'")
+
+
+def backend_ops(names):
+    """_ops with the power operator of a make_names() table (exact for Fractions)."""
+    return {**_ops, ast.Pow: names["pow"]}
+
+
+def _fraction(text):
+    """Fraction of a literal, sized first: Fraction("1e10000000") is a
+    ten-million-digit int (Decimal keeps the exponent apart, so it needs no check)."""
+    from fractions import Fraction
+
+    mantissa, _, exponent = text.lower().partition("e")
+    if exponent:
+        check_digits(len(mantissa) + abs(int(exponent)), "Number")
+    return Fraction(text)
+
+
+def number_type(backend):
+    """Literal constructor of a backend, fed the literal's source text; None for floats."""
+    if backend == "float":
+        return None
+    from decimal import Decimal
+
+    return {"decimal": Decimal, "fraction": _fraction}[backend]
+
+
+def _check_constant(value):
+    """Only numbers are literals: "'a'*10^8" would build a string outside the cost checks."""
+    if type(value) not in (int, float, complex):
+        raise TypeError(f"Unsupported constant: {type(value)}")
+
+
+def _eval(node, names, ops=_ops, number=None):
+    """Recursively evaluate AST node using allowed operators and names.
+
+    With a `number` type, literals are converted through their repr.
+    """
+    if isinstance(node, ast.Expression):
+        return _eval(node.body, names, ops, number)
+    if isinstance(node, ast.Constant):  # Python 3.8+
+        _check_constant(node.value)
+        return node.value if number is None else number(repr(node.value))
+    if isinstance(node, ast.Num):  # older AST
+        return node.n if number is None else number(repr(node.n))
+    if isinstance(node, ast.BinOp):
+        left = _eval(node.left, names, ops, number)
+        right = _eval(node.right, names, ops, number)
+        op_type = type(node.op)
+        if op_type in ops:
+            return ops[op_type](left, right)
+        raise ValueError("Unsupported binary operator")
+    if isinstance(node, ast.UnaryOp):
+        operand = _eval(node.operand, names, ops, number)
+        op_type = type(node.op)
+        if op_type in ops:
+            return ops[op_type](operand)
+        raise ValueError("Unsupported unary operator")
+    if isinstance(node, ast.Call):
+        # only allow direct function names, no attributes
+        if isinstance(node.func, ast.Name):
+            fname = node.func.id
+            if fname not in names:
+                raise NameError(f"Unknown function '{fname}'")
+            func = names[fname]
+            args = [_eval(a, names, ops, number) for a in node.args]
+            return func(*args)
+        raise NameError("Only direct function calls allowed")
+    if isinstance(node, ast.Name):
+        if node.id in names:
+            return names[node.id]
+        raise NameError(f"Unknown identifier '{node.id}'")
+    raise TypeError(f"Unsupported AST node: {type(node)}")
+
+# Preprocessing: convert calculator-style tokens to Python-friendly AST input
+FACTORIAL_RE = re.compile(r'(\d+|\))\s*!')  # e.g., 5! or (expr)!
+
+def preprocess(expr: str) -> str:
+    # normalize
+    s = expr.strip()
+    s = s.replace("−", "-")
+    # ^ to **
+    s = s.replace("^", "**")
+    # pi/e unicode or typed:
+    s = s.replace("π", "pi")
+    # replace factorial postfix n! or (expr)! with factorial(n)
+    # This is a simple transform sufficient for calculator inputs like 5!, (3+2)! etc.
+    # Loop until no change so nested cases handled (e.g., (2+3)! )
+    prev = None
+    while prev != s:
+        prev = s
+        s = FACTORIAL_RE.sub(r'factorial(\1)', s)
+    return s
+
+# Name tables are built once per mode, not on every evaluation
+NAMES = {mode: make_names(mode) for mode in ("DEG", "RAD")}
+
+
+# ---------------- Constant folding ----------------
+# _compile evaluates every subtree without free variables once, at compile
+# time (sin(30), pi/180, 2^10): the compiled closure just returns the value.
+# Identities around a variable (x*1, x+0, x^1, +x, --x) compile to the
+# variable itself. Folded function calls and powers are also remembered by
+# their source text, so editing a long expression re-runs the trig, logs
+# and big powers of the parts that changed only; plain + - * / costs less
+# to recompute than to look up.
+_IDENTITIES = {  # (op, right operand) pairs that return the left operand
+    (ast.Add, 0), (ast.Sub, 0), (ast.Mult, 1), (ast.Div, 1), (ast.Pow, 1),
+}
+_LEFT_IDENTITIES = {(ast.Add, 0), (ast.Mult, 1)}  # 0+x, 1*x
+_MEMO_TEXT = 256  # longer subexpressions aren't remembered (bytes of source)
+
+# Remembered subexpression values; override with RBI_CALC_SUBEXPR_MEMO
+SUBEXPR_MEMO_SIZE = int(os.environ.get("RBI_CALC_SUBEXPR_MEMO", 4096))
+
+
+class SubexprMemo:
+    """LRU map of (context, source text) -> value of a constant subexpression."""
+
+    def __init__(self):
+        self.hits = self.misses = 0
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._values.get(key, default)
+            if value is default:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._values.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > SUBEXPR_MEMO_SIZE:
+                self._values.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self.hits = self.misses = 0
+
+
+subexpr_memo = SubexprMemo()
+_MISSING = object()
+
+
+class _Constant:
+    """A compiled node folded to `value`."""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, env):
+        return self.value
+
+
+def _literal(fn):
+    """The int/float a compiled node folded to, or None."""
+    if type(fn) is _Constant and type(fn.value) in (int, float):
+        return fn.value
+    return None
+
+
+class _Source:
+    """Parsed text as UTF-8 bytes, sliced by AST node positions.
+
+    Node columns are byte offsets within their line, so multi-line input
+    needs the line starts (ast.get_source_segment re-splits the lines on
+    every call).
+    """
+    __slots__ = ("text", "starts")
+
+    def __init__(self, source):
+        self.text = source.encode()
+        self.starts = [0]
+        for line in self.text.splitlines(keepends=True):
+            self.starts.append(self.starts[-1] + len(line))
+
+    def span(self, node):
+        return (self.starts[node.lineno - 1] + node.col_offset,
+                self.starts[node.end_lineno - 1] + node.end_col_offset)
+
+
+def _compile(node, names, variables=(), ops=_ops, number=None, source=None, memo=None):
+    """Compile an AST node into a closure taking a variable env.
+
+    Same rules as _eval, but all checks and name lookups happen once here
+    and constant subtrees are folded; calling the result only runs the
+    arithmetic left. Identifiers listed in `variables` are read from the
+    env dict at call time. `source` is the parsed text as a _Source: with
+    a `number` type (exact backends), literals are converted from it, so
+    0.1 stays exactly one tenth. With a `memo` context (which needs
+    `source`), folded calls and powers are looked up in and saved to
+    subexpr_memo by their text.
+    """
+    def sub(child):
+        kind = type(child)
+        # only calls and powers are worth a lookup
+        if memo is None or not (kind is ast.Call or kind is ast.BinOp and type(child.op) is ast.Pow):
+            return _compile(child, names, variables, ops, number, source, memo)
+        start, end = source.span(child)
+        if end - start > _MEMO_TEXT:
+            return _compile(child, names, variables, ops, number, source, memo)
+        key = (memo, source.text[start:end])
+        value = subexpr_memo.get(key, _MISSING)
+        if value is not _MISSING:
+            return _Constant(value)
+        fn = _compile(child, names, variables, ops, number, source, memo)
+        if type(fn) is _Constant:
+            subexpr_memo.put(key, fn.value)
+        return fn
+
+    if isinstance(node, ast.Expression):
+        return sub(node.body)
+    if isinstance(node, ast.Constant):
+        value = node.value
+        _check_constant(value)
+        if number is not None:
+            text = None
+            if source is not None:
+                start, end = source.span(node)
+                text = source.text[start:end].decode()
+            value = number(text or repr(value))
+        return _Constant(value)
+    if isinstance(node, ast.BinOp):
+        op_type = type(node.op)
+        op = ops.get(op_type)
+        if op is None:
+            raise ValueError("Unsupported binary operator")
+        left = sub(node.left)
+        right = sub(node.right)
+        if type(left) is _Constant and type(right) is _Constant:
+            return _Constant(op(left.value, right.value))
+        if (op_type, _literal(right)) in _IDENTITIES:
+            return left
+        if (op_type, _literal(left)) in _LEFT_IDENTITIES:
+            return right
+        return lambda env: op(left(env), right(env))
+    if isinstance(node, ast.UnaryOp):
+        op_type = type(node.op)
+        op = ops.get(op_type)
+        if op is None:
+            raise ValueError("Unsupported unary operator")
+        operand = sub(node.operand)
+        if type(operand) is _Constant:
+            return _Constant(op(operand.value))
+        if op_type is ast.UAdd:
+            return operand
+        if (op_type is ast.USub and isinstance(node.operand, ast.UnaryOp)
+                and type(node.operand.op) is ast.USub):
+            return sub(node.operand.operand)  # --x
+        return lambda env: op(operand(env))
+    if isinstance(node, ast.Call):
+        # only allow direct function names, no attributes
+        if isinstance(node.func, ast.Name):
+            fname = node.func.id
+            if fname not in names:
+                raise NameError(f"Unknown function '{fname}'")
+            func = names[fname]
+            args = [sub(a) for a in node.args]
+            if all(type(a) is _Constant for a in args):
+                return _Constant(func(*[a.value for a in args]))
+            if len(args) == 1:
+                arg = args[0]
+                return lambda env: func(arg(env))
+            return lambda env: func(*[a(env) for a in args])
+        raise NameError("Only direct function calls allowed")
+    if isinstance(node, ast.Name):
+        if node.id in names:
+            return _Constant(names[node.id])
+        if node.id in variables:
+            name = node.id
+            return lambda env: env[name]
+        raise NameError(f"Unknown identifier '{node.id}'")
+    raise TypeError(f"Unsupported AST node: {type(node)}")
+
+
+@lru_cache(maxsize=1024)
+def compile_expr(expr: str, mode: str, backend: str = "float", precision: int = DEFAULT_PRECISION):
+    """Preprocess, parse and compile `expr` once per (expr, mode, backend, precision).
+
+    Exact backends fold constants with the current decimal context, so call
+    this inside localcontext(prec=precision) as safe_eval does.
+    """
+    source = preprocess(expr)
+    parsed = ast.parse(source, mode="eval")
+    text = _Source(source)
+    if backend == "float":
+        return _compile(parsed, NAMES[mode], source=text, memo=(mode, backend))
+    names = make_names(mode, backend, precision)
+    return _compile(parsed, names, ops=backend_ops(names), number=number_type(backend),
+                    source=text, memo=(mode, backend, precision))
+
+
+def safe_eval(expr: str, mode: str, backend: str = "float", precision: int = DEFAULT_PRECISION):
+    """Evaluate `expr`; `backend` picks float, Decimal or Fraction arithmetic."""
+    if not expr:
+        raise ValueError("Empty expression")
+    if backend == "float":
+        return compile_expr(expr, mode)(None)
+    from decimal import localcontext
+
+    with localcontext() as ctx:
+        ctx.prec = precision
+        result = +compile_expr(expr, mode, backend, precision)(None)
+    # Decimal gives Infinity for 0^-1 and ln(0) where floats raise
+    if backend == "decimal" and not result.is_finite():
+        raise ValueError("math domain error")
+    return result
+
+
+def format_result(value):
+    """Display form of a result: integral floats shown as ints, floats to
+    12 significant digits, Decimals in full, Fractions as "p/q"."""
+    if isinstance(value, float):
+        if value.is_integer():
+            return str(int(value))
+        return f"{value:.12g}"
+    if type(value).__name__ == "Decimal":
+        from decimal import localcontext
+
+        with localcontext() as ctx:  # normalize() rounds to the context; keep every digit
+            ctx.prec = max(ctx.prec, len(value.as_tuple().digits))
+            value = value.normalize()
+        return format(value, "f") if value == value.to_integral_value() else str(value)
+    return str(value)
+
+
+# ---------------- Array mode (NumPy) ----------------
+# The same expressions evaluated element-wise over NumPy arrays, e.g.
+# eval_array("sin(x)^2 + ln(x)", "RAD", x=np.linspace(1, 10, 10**7)).
+# numpy is only imported the first time array mode is used.
+
+@lru_cache(maxsize=None)
+def _factorial_table():
+    import numpy as np
+
+    # n! for n = 0..170; 171! overflows float64
+    return np.concatenate(([1.0], np.cumprod(np.arange(1, 171, dtype=float))))
+
+
+def _factorial_array(x):
+    """Element-wise n!: inf above 170!, nan for negative or non-integer n."""
+    import numpy as np
+
+    x = np.asarray(x, dtype=float)
+    table = _factorial_table()
+    valid = (x >= 0) & (x == np.floor(x))
+    index = np.clip(np.where(valid, x, 0), 0, len(table) - 1).astype(np.intp)
+    out = np.where(x < len(table), table[index], np.inf)
+    return np.where(valid, out, np.nan)
+
+
+@lru_cache(maxsize=None)
+def make_array_names(mode: str):
+    """NumPy ufunc equivalents of make_names(mode), built once per mode."""
+    import numpy as np
+
+    if mode == "DEG":
+        trig = {
+            "sin": lambda x: np.sin(np.radians(x)),
+            "cos": lambda x: np.cos(np.radians(x)),
+            "tan": lambda x: np.tan(np.radians(x)),
+            "asin": lambda x: np.degrees(np.arcsin(x)),
+            "acos": lambda x: np.degrees(np.arccos(x)),
+            "atan": lambda x: np.degrees(np.arctan(x)),
+        }
+    else:  # RAD
+        trig = {
+            "sin": np.sin,
+            "cos": np.cos,
+            "tan": np.tan,
+            "asin": np.arcsin,
+            "acos": np.arccos,
+            "atan": np.arctan,
+        }
+    return {
+        **trig,
+        "sqrt": np.sqrt,
+        "log": np.log10,
+        "ln": np.log,
+        "factorial": _factorial_array,
+        "abs": np.abs,
+        "pow": np.power,
+        "pi": np.pi,
+        "e": np.e,
+    }
+
+
+@lru_cache(maxsize=256)
+def compile_array_expr(expr: str, mode: str, variables=("x",)):
+    """Like compile_expr, but with NumPy names and free `variables`."""
+    parsed = ast.parse(preprocess(expr), mode="eval")
+    return _compile(parsed, make_array_names(mode), tuple(variables))
+
+
+def eval_array(expr: str, mode: str, **arrays):
+    """Evaluate `expr` over NumPy arrays in one vectorized pass.
+
+    Keyword arguments bind the expression's variables, e.g. x=np.arange(5).
+    Domain errors give nan/inf (NumPy semantics) instead of raising.
+    """
+    import numpy as np
+
+    if not expr:
+        raise ValueError("Empty expression")
+    env = {name: np.asarray(values, dtype=float) for name, values in arrays.items()}
+    with np.errstate(all="ignore"):  # also while folding constants, e.g. log(0) in x+log(0)
+        fn = compile_array_expr(expr, mode, tuple(sorted(arrays)))
+        result = np.asarray(fn(env), dtype=float)
+    # constant expressions (e.g. "2*pi") still give one value per input
+    shape = np.broadcast_shapes(*(v.shape for v in env.values()))
+    if result.shape != shape:
+        result = np.broadcast_to(result, shape).copy()
+    elif any(np.may_share_memory(result, v) for v in env.values()):
+        result = result.copy()  # "x", "x*1" (identity folding): never hand back the input
+    return result
+
+
+def tabulate(expr: str, mode: str, start: float, stop: float, num: int = 1000):
+    """(x, f(x)) for `num` evenly spaced points, ready to plot."""
+    import numpy as np
+
+    x = np.linspace(start, stop, num)
+    return x, eval_array(expr, mode, x=x)
+
+
+# ---------------- Evaluators of the other calculator apps ----------------
+def replace_eval(expr: str, mode: str):
+    """ercl.py's old evaluator: rewrite tokens with str.replace, then eval.
+
+    Kept as a baseline; it mangles any `e` inside a token (sec, 1e5).
+    """
+    expr = expr.replace("^", "**").replace("√", "math.sqrt")
+    expr = expr.replace("π", str(math.pi)).replace("e", str(math.e))
+    if mode == "DEG":
+        expr = expr.replace("sin(", "math.sin(math.radians(")
+        expr = expr.replace("cos(", "math.cos(math.radians(")
+        expr = expr.replace("tan(", "math.tan(math.radians(")
+    else:
+        expr = expr.replace("sin(", "math.sin(")
+        expr = expr.replace("cos(", "math.cos(")
+        expr = expr.replace("tan(", "math.tan(")
+    return eval(expr, {"__builtins__": None}, math.__dict__)
+
+
+def basic_eval(expr: str, mode: str = "RAD"):
+    """calculatorscientific.py's evaluator: eval over the math namespace.
+
+    `mode` is accepted for a uniform signature; this engine is RAD only.
+    """
+    return eval(expr, {"__builtins__": None}, math.__dict__)
+
+
+def pratt_eval(expr: str, mode: str):
+    """ercl.py's evaluator: expr_parser's single-pass tokenizer and parser."""
+    from expr_parser import evaluate
+
+    return evaluate(expr, mode)
+
+
+# Evaluators by name, all called as fn(expr, mode)
+ENGINES = {
+    "ast": safe_eval,
+    "pratt": pratt_eval,
+    "replace": replace_eval,
+    "basic": basic_eval,
+}
@@ -0,0 +1,240 @@
+"""Live result of a calculator expression while it is being typed.
+
+    live = LiveExpression("DEG")
+    for key in ["2", "*", "sin(", "3", "0"]:
+        live.push(key)
+    live.preview()                  # 1.0: sin(30 closed for the preview
+
+A shunting-yard parser fed one keypad token at a time. Operators are
+applied as soon as precedence allows (2+3+ already holds 5), so push() does
+O(token) work however long the expression gets, and preview() only folds
+the operators still pending: a couple for a flat chain like 1+2*3+4*5...,
+one per open parenthesis when nested. Nothing is re-parsed per keypress.
+
+The preview runs in the page's process, outside calc_worker's CPU budget,
+so it always uses float arithmetic (a Decimal page shows the float value
+to 12 digits; "=" still gives the exact result). Every step is then cheap:
+floats overflow instead of growing, and integers are capped at
+calc_engine.MAX_DIGITS digits (pow and factorial check before computing,
+other results after), past which the preview is blank.
+
+The grammar is the one safe_eval accepts for keypad input, with the same
+names, operators and cost guards (calc_engine.NAMES):
+
+    + -          binary, left-associative
+    * / // %     binary, left-associative
+    - +          prefix (so -2^2 = -4)
+    ^ **         power, right-associative (2^-1 works)
+    n!           factorial of a whole-number literal, as preprocess() reads it
+    name(...)    functions; π and pi, e as constants
+
+Input safe_eval would reject ("2π", "007", ")(", "Error5") makes the state
+invalid until it is rebuilt; preview() is then None. Open parentheses are
+closed for the preview, so "sqrt(16" already shows 4.
+"""
+import ast
+import math
+
+import calc_engine
+from calc_engine import NAMES, backend_ops
+
+_BINARY = {
+    "+": (1, ast.Add), "-": (1, ast.Sub),
+    "*": (2, ast.Mult), "/": (2, ast.Div), "//": (2, ast.FloorDiv), "%": (2, ast.Mod),
+    "^": (4, ast.Pow), "**": (4, ast.Pow),
+}
+_PREFIX = {"+": ast.UAdd, "-": ast.USub}
+_PREFIX_PREC = 3  # between * / and ^, like Python
+_PAREN = -1  # precedence of "(" entries: never reduced by an operator
+
+
+def _number(text):
+    """Python's value of a literal (None if not a valid literal)."""
+    try:
+        return int(text) if text.isdigit() else float(text)
+    except ValueError:  # also past Python's 4300-digit int parsing limit
+        return None
+
+
+def _capped(value):
+    """`value`, unless it is an int of more than MAX_DIGITS digits."""
+    if type(value) is int and value.bit_length() > calc_engine.MAX_DIGITS / math.log10(2):
+        raise OverflowError("Integer too large for the preview")
+    return value
+
+
+class LiveExpression:
+    """Shunting-yard state of an expression typed one token at a time.
+
+    `values` is the operand stack; `pending` holds operators not applied yet
+    as (precedence, fn, nargs) and open parentheses as (_PAREN, function or
+    None, 0). `literal` is the number or name still being typed, `op` a
+    binary operator waiting for the next character (* and / may double).
+    """
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.names = NAMES[mode]
+        ops = backend_ops(self.names)
+        self._binary_ops = {sym: (prec, ops[op]) for sym, (prec, op) in _BINARY.items()}
+        self._prefix = {sym: ops[op] for sym, op in _PREFIX.items()}
+        self.length = 0  # characters pushed so far
+        self.values = []
+        self.pending = []
+        self.literal = ""
+        self.op = ""
+        self.operand = True  # an operand (or prefix operator) comes next
+        self.error = None  # first SyntaxError or arithmetic error, kept until rebuilt
+
+    def push(self, text: str):
+        """Append keypad text ("7", "sin(", "^", or a whole string) to the state."""
+        self.length += len(text)
+        if self.error is not None:
+            return
+        try:
+            for ch in text:
+                self._feed(ch)
+        except Exception as e:
+            self.error = e
+
+    def preview(self):
+        """Value of the expression as typed so far, open parentheses closed;
+        None while it is incomplete ("2+") or invalid."""
+        if self.error is not None or not self.length:
+            return None
+        try:
+            return self._fold()
+        except Exception:
+            return None
+
+    # ---------------- parsing ----------------
+    def _feed(self, ch):
+        if self.op:
+            op, self.op = self.op, ""
+            if ch == op and op in "*/":
+                self._binary(op + ch)  # ** and //
+                return
+            self._binary(op)
+        literal = self.literal
+        if ch.isdigit() or ch == ".":
+            if literal[:1].isalpha() or not self.operand:  # log2, 2π5, )5
+                raise SyntaxError(f"Unexpected {ch!r}")
+            if ch == "." and ("." in literal or "e" in literal.lower()):
+                raise SyntaxError("Malformed number")
+            self.literal += ch
+        elif ch.isalpha() or ch == "π":
+            if literal and not literal[0].isalpha() and ch in "eE" and "e" not in literal.lower():
+                self.literal += ch  # exponent: 1E+30 from a decimal result
+            elif ch == "π":
+                self._flush()
+                self._operand(self.names["pi"])
+            elif literal and not literal[0].isalpha() or not self.operand:
+                raise SyntaxError(f"Unexpected {ch!r}")  # 2sin(, )e
+            else:
+                self.literal += ch
+        elif ch in "+-" and literal[-1:] in ("e", "E") and not literal[0].isalpha():
+            self.literal += ch  # exponent sign: 1E+30
+        elif ch in _BINARY:
+            self._flush()
+            if self.operand:
+                if ch not in _PREFIX:
+                    raise SyntaxError(f"Unexpected {ch!r}")
+                self.pending.append((_PREFIX_PREC, self._prefix[ch], 1))
+            else:
+                self.op = ch
+        elif ch == "(":
+            func = None
+            if literal:
+                func = self.names.get(literal) if literal[0].isalpha() else None
+                if not callable(func):
+                    raise SyntaxError(f"Unexpected '(' after {literal!r}")
+                self.literal = ""
+            elif not self.operand:
+                raise SyntaxError("Unexpected '('")  # )( or 2(
+            self.pending.append((_PAREN, func, 0))
+        elif ch == ")":
+            self._flush()
+            if self.operand:
+                raise SyntaxError("Unexpected ')'")
+            while self.pending and self.pending[-1][0] != _PAREN:
+                self._reduce()
+            if not self.pending:
+                raise SyntaxError("Unmatched ')'")
+            _, func, _ = self.pending.pop()
+            if func is not None:
+                self.values[-1] = _capped(func(self.values[-1]))
+        elif ch == "!":
+            # preprocess() turns "12!" into factorial(12); nothing else takes "!"
+            if not literal.isdigit():
+                raise SyntaxError("Unexpected '!'")
+            self.literal = ""
+            self._operand(self.names["factorial"](self._value(literal)))
+        elif ch.isspace():
+            if literal and not literal[0].isalpha():
+                self._flush()  # "2 3" is two numbers, not 23
+        else:
+            raise SyntaxError(f"Unexpected {ch!r}")
+
+    def _value(self, literal):
+        """Value of a finished literal (number or constant name)."""
+        if literal[0].isalpha():
+            value = self.names.get(literal)
+            if value is None or callable(value):
+                raise NameError(f"Unknown identifier '{literal}'")
+            return value
+        if literal.isdigit() and literal[0] == "0" and literal.strip("0"):
+            raise SyntaxError("Leading zeros in a number")  # 007, as Python rejects it
+        value = _number(literal)
+        if value is None:  # ".", "1e", "1e+"
+            raise SyntaxError(f"Malformed number {literal!r}")
+        return value
+
+    def _flush(self):
+        if self.literal:
+            literal, self.literal = self.literal, ""
+            self._operand(self._value(literal))
+
+    def _operand(self, value):
+        if not self.operand:
+            raise SyntaxError("Missing operator")
+        self.values.append(value)
+        self.operand = False
+
+    def _binary(self, op):
+        prec, fn = self._binary_ops[op]
+        right = prec == _BINARY["^"][0]
+        while self.pending and (self.pending[-1][0] > prec or self.pending[-1][0] == prec and not right):
+            self._reduce()
+        self.pending.append((prec, fn, 2))
+        self.operand = True
+
+    def _reduce(self):
+        _, fn, nargs = self.pending.pop()
+        if nargs == 1:
+            self.values[-1] = _capped(fn(self.values[-1]))
+        else:
+            right = self.values.pop()
+            self.values[-1] = _capped(fn(self.values[-1], right))
+
+    def _fold(self):
+        """Apply every pending operator to copies of the stacks."""
+        if self.op:
+            return None
+        values = self.values[:]
+        operand = self.operand
+        if self.literal:
+            if not operand:
+                return None
+            values.append(self._value(self.literal))
+            operand = False
+        if operand:
+            return None
+        for _, fn, nargs in reversed(self.pending):
+            if fn is None:  # a plain "("
+                continue
+            if nargs == 2:
+                right = values.pop()
+                values[-1] = _capped(fn(values[-1], right))
+            else:  # prefix operator or function call
+                values[-1] = _capped(fn(values[-1]))
+        return values[-1]
@@ -0,0 +1,84 @@
+"""Calculator evaluations in a killable worker process.
+
+    value = bounded_eval("2^10000", "DEG")
+    value = bounded_eval(expr, "RAD", backend="decimal", precision=100, cpu_seconds=0.5)
+
+safe_eval's digit budget (calc_engine.MAX_DIGITS) rejects oversized
+big-integer pow and factorial calls before they start. This module handles
+anything else that runs too long. Each evaluation runs in a separate
+process with a CPU-time budget. Where setitimer exists, a SIGPROF timer
+stops Python-level work once the budget is spent. If the worker has still
+not answered after the budget plus KILL_GRACE seconds (wall clock), it is
+killed and replaced. A Streamlit session waiting on a runaway expression
+gets a TimeoutError, and no other session slows down.
+
+Workers are reused, so only the first call pays the process start (about
+0.1 s). Up to MAX_IDLE workers are kept between calls; concurrent callers
+each get their own.
+"""
+import atexit
+import os
+import queue
+
+from calc_engine import DEFAULT_PRECISION, safe_eval
+from pipe_worker import Worker
+
+# CPU seconds per evaluation; override with RBI_CALC_CPU_SECONDS
+DEFAULT_CPU_SECONDS = float(os.environ.get("RBI_CALC_CPU_SECONDS", 1.0))
+KILL_GRACE = 0.5  # wall-clock seconds on top of the budget before the kill
+MAX_IDLE = 2
+
+_idle = queue.LifoQueue()  # started workers waiting for the next evaluation
+
+
+def _new_worker():
+    return Worker(preload=("calc_engine",))
+
+
+def _release(worker):
+    if _idle.qsize() < MAX_IDLE:
+        _idle.put(worker)
+    else:
+        worker.kill()
+
+
+def bounded_eval(expr: str, mode: str, backend: str = "float", precision: int = DEFAULT_PRECISION,
+                 cpu_seconds: float = DEFAULT_CPU_SECONDS):
+    """safe_eval in a worker process, killed if it runs past its budget."""
+    if not expr:
+        raise ValueError("Empty expression")
+    try:
+        worker = _idle.get_nowait()
+    except queue.Empty:
+        worker = _new_worker()
+    try:
+        status, value = worker.call(safe_eval, (expr, mode, backend, precision),
+                                    cpu_seconds, timeout=cpu_seconds + KILL_GRACE)
+    except (queue.Empty, OSError):
+        # stuck in C code (a huge int op), or its pipe broke
+        worker.kill()
+        raise TimeoutError(f"Evaluation took longer than {cpu_seconds:g}s") from None
+    except EOFError:  # died, e.g. out of memory
+        worker.kill()
+        raise RuntimeError("Calculator worker exited during the evaluation") from None
+    _release(worker)
+    if status == "error":
+        raise value
+    return value
+
+
+def start():
+    """Start a worker ahead of the first evaluation (e.g. when the page loads)."""
+    if _idle.empty():
+        _release(_new_worker())
+
+
+@atexit.register
+def shutdown():
+    """Stop the idle workers."""
+    while True:
+        try:
+            _idle.get_nowait().kill()
+        except queue.Empty:
+            return
+
@@ -1,9 +1,12 @@
 # app.py
 import streamlit as st
-import ast
-import operator
-import math
-import re
+
+# Safe AST evaluator (runs only when '=' pressed)
+from calc_engine import BACKENDS, DEFAULT_PRECISION, format_result
+# Evaluations run in a worker process with a CPU-time budget
+from calc_worker import bounded_eval, start as start_worker
+# Live preview: parsed one key at a time, never the whole string per click
+from calc_live import LiveExpression
 
 # ---------------- Page config ----------------
 st.set_page_config(page_title="Casio-lite Fast Scientific", page_icon="🧮", layout="centered")
@@ -21,6 +24,7 @@ body { background: var(--bg); color: #e6eef0; font-family: Inter, system-ui, -ap
 .title { color: var(--accent); font-weight:700; font-size:18px; }
 .sub { color: var(--muted); font-size:12px; margin-bottom:8px; }
 .display { background:#031018; border:1px solid rgba(0,230,214,0.06); color:var(--accent); padding:10px 12px; border-radius:8px; text-align:right; font-family:'Roboto Mono', monospace; font-size:22px; min-height:56px; }
+.preview { color:var(--muted); text-align:right; font-family:'Roboto Mono', monospace; font-size:14px; min-height:20px; }
 .row { display:flex; gap:8px; margin-top:8px; }
 .col { flex:1; }
 .btn { background:var(--key); color:#e6eef0; border-radius:8px; height:50px; width:100%; border:0; font-size:15px; box-shadow: 0 2px 0 rgba(0,0,0,0.5); }
@@ -44,151 +48,67 @@ if "mode" not in st.session_state:
     st.session_state.mode = "DEG"  # or "RAD"
 if "last" not in st.session_state:
     st.session_state.last = None
+if "backend" not in st.session_state:
+    st.session_state.backend = "float"  # or "decimal" / "fraction"
+if "precision" not in st.session_state:
+    st.session_state.precision = DEFAULT_PRECISION
+if "live" not in st.session_state:
+    st.session_state.live = None  # LiveExpression of expr, built on first use
 
-# ---------------- Safe AST evaluator (runs only when '=' pressed) ----------------
-# Allowed binary/unary operators
-_ops = {
-    ast.Add: operator.add,
-    ast.Sub: operator.sub,
-    ast.Mult: operator.mul,
-    ast.Div: operator.truediv,
-    ast.Pow: operator.pow,
-    ast.Mod: operator.mod,
-    ast.FloorDiv: operator.floordiv,
-    ast.USub: operator.neg,
-    ast.UAdd: operator.pos,
-}
-
-def make_names(mode: str):
-    """Return allowed functions/constants based on DEG/RAD mode."""
-    if mode == "DEG":
-        return {
-            "sin": lambda x: math.sin(math.radians(x)),
-            "cos": lambda x: math.cos(math.radians(x)),
-            "tan": lambda x: math.tan(math.radians(x)),
-            "asin": lambda x: math.degrees(math.asin(x)),
-            "acos": lambda x: math.degrees(math.acos(x)),
-            "atan": lambda x: math.degrees(math.atan(x)),
-            "sqrt": math.sqrt,
-            "log": lambda x: math.log10(x),
-            "ln": math.log,
-            "factorial": math.factorial,
-            "abs": abs,
-            "pow": pow,
-            "pi": math.pi,
-            "e": math.e,
-        }
-    else:  # RAD
-        return {
-            "sin": math.sin,
-            "cos": math.cos,
-            "tan": math.tan,
-            "asin": math.asin,
-            "acos": math.acos,
-            "atan": math.atan,
-            "sqrt": math.sqrt,
-            "log": lambda x: math.log10(x),
-            "ln": math.log,
-            "factorial": math.factorial,
-            "abs": abs,
-            "pow": pow,
-            "pi": math.pi,
-            "e": math.e,
-        }
-
-def _eval(node, names):
-    """Recursively evaluate AST node using allowed operators and names."""
-    if isinstance(node, ast.Expression):
-        return _eval(node.body, names)
-    if isinstance(node, ast.Constant):  # Python 3.8+
-        return node.value
-    if isinstance(node, ast.Num):  # older AST
-        return node.n
-    if isinstance(node, ast.BinOp):
-        left = _eval(node.left, names)
-        right = _eval(node.right, names)
-        op_type = type(node.op)
-        if op_type in _ops:
-            return _ops[op_type](left, right)
-        raise ValueError("Unsupported binary operator")
-    if isinstance(node, ast.UnaryOp):
-        operand = _eval(node.operand, names)
-        op_type = type(node.op)
-        if op_type in _ops:
-            return _ops[op_type](operand)
-        raise ValueError("Unsupported unary operator")
-    if isinstance(node, ast.Call):
-        # only allow direct function names, no attributes
-        if isinstance(node.func, ast.Name):
-            fname = node.func.id
-            if fname not in names:
-                raise NameError(f"Unknown function '{fname}'")
-            func = names[fname]
-            args = [_eval(a, names) for a in node.args]
-            return func(*args)
-        raise NameError("Only direct function calls allowed")
-    if isinstance(node, ast.Name):
-        if node.id in names:
-            return names[node.id]
-        raise NameError(f"Unknown identifier '{node.id}'")
-    raise TypeError(f"Unsupported AST node: {type(node)}")
-
-# Preprocessing: convert calculator-style tokens to Python-friendly AST input
-FACTORIAL_RE = re.compile(r'(\d+|\))\s*!')  # e.g., 5! or (expr)!
-
-def preprocess(expr: str) -> str:
-    # normalize
-    s = expr.strip()
-    s = s.replace("−", "-")
-    # ^ to **
-    s = s.replace("^", "**")
-    # pi/e unicode or typed:
-    s = s.replace("π", "pi")
-    # replace factorial postfix n! or (expr)! with factorial(n)
-    # This is a simple transform sufficient for calculator inputs like 5!, (3+2)! etc.
-    # Loop until no change so nested cases handled (e.g., (2+3)! )
-    prev = None
-    while prev != s:
-        prev = s
-        s = FACTORIAL_RE.sub(r'factorial(\1)', s)
-    return s
-
-def safe_eval(expr: str, mode: str):
-    if not expr:
-        raise ValueError("Empty expression")
-    s = preprocess(expr)
-    parsed = ast.parse(s, mode="eval")
-    names = make_names(mode)
-    return _eval(parsed, names)
+# start the evaluation worker while the user is still typing
+start_worker()
 
 # ---------------- Helpers to modify expression/state ----------------
+def live_expr():
+    """The session's LiveExpression, rebuilt if expr or the angle mode changed under it."""
+    live = st.session_state.live
+    if live is None or live.mode != st.session_state.mode or live.length != len(st.session_state.expr):
+        live = st.session_state.live = LiveExpression(st.session_state.mode)
+        live.push(st.session_state.expr)
+    return live
+
 def append_token(tok: str):
+    live = live_expr()
     st.session_state.expr += tok
+    live.push(tok)  # O(token): only the new key is parsed
 
 def clear_expr():
     st.session_state.expr = ""
+    st.session_state.live = None
+
+def evaluate(expr: str):
+    """safe_eval with the selected number mode, killed if it runs too long."""
+    return bounded_eval(expr, st.session_state.mode, st.session_state.backend, st.session_state.precision)
 
 def do_equals():
     try:
-        val = safe_eval(st.session_state.expr, st.session_state.mode)
+        val = evaluate(st.session_state.expr)
         st.session_state.last = val
-        # format result: integers as int, floats trimmed
-        if isinstance(val, float):
-            if val.is_integer():
-                st.session_state.expr = str(int(val))
-            else:
-                # limit to 12 significant decimal digits to keep display sane
-                s = f"{val:.12g}"
-                st.session_state.expr = s
-        else:
-            st.session_state.expr = str(val)
+        # integers as int, floats to 12 significant digits, Decimals in full, Fractions as p/q
+        st.session_state.expr = format_result(val)
     except Exception:
         st.session_state.expr = "Error"
+    st.session_state.live = None  # expr replaced: re-read on the next render
 
 # ---------------- UI (single container) ----------------
 st.markdown("<div class='container'>", unsafe_allow_html=True)
 st.markdown("<div class='header'><div class='title'>Casio-lite — Fast Scientific</div><div class='sub'>Mode: <strong>{}</strong> · Memory: <strong>{}</strong></div></div>".format(st.session_state.mode, st.session_state.memory), unsafe_allow_html=True)
+# Number mode: binary floats (fast) or exact decimal / rational arithmetic
+BACKEND_LABELS = {"float": "Float", "decimal": "Decimal", "fraction": "Exact fraction"}
+num_cols = st.columns([3, 1], gap="small")
+with num_cols[0]:
+    st.radio("Numbers", BACKENDS, key="backend", horizontal=True, format_func=BACKEND_LABELS.get)
+with num_cols[1]:
+    st.number_input("Digits", min_value=6, max_value=200, step=1, key="precision",
+                    disabled=st.session_state.backend == "float")
 st.markdown(f"<div class='display'>{st.session_state.expr or '0'}</div>", unsafe_allow_html=True)
+# result so far, open brackets closed ("2*sqrt(16" shows = 8); blank while incomplete.
+# Always float arithmetic (cheap in this process): only "≈" in the exact number modes
+preview = live_expr().preview()
+shown = format_result(preview) if preview is not None else ""
+sign = "= " if st.session_state.backend == "float" else "≈ "
+st.markdown(f"<div class='preview'>{sign + shown if shown not in ('', st.session_state.expr) else ''}</div>",
+            unsafe_allow_html=True)
 
 # Button rows: keep simple tokens (no heavy processing on clicks)
 rows = [
@@ -229,14 +149,14 @@ for r_i, row in enumerate(rows):
                     append_token(str(st.session_state.memory))
                 elif label == "M+":
                     try:
-                        # evaluate quickly (use safe_eval)
-                        v = safe_eval(st.session_state.expr or "0", st.session_state.mode)
+                        # evaluate quickly (bounded, like '=')
+                        v = evaluate(st.session_state.expr or "0")
                         st.session_state.memory += float(v)
                     except Exception:
                         pass
                 elif label == "M-":
                     try:
-                        v = safe_eval(st.session_state.expr or "0", st.session_state.mode)
+                        v = evaluate(st.session_state.expr or "0")
                         st.session_state.memory -= float(v)
                     except Exception:
                         pass
@@ -1,6 +1,8 @@
 import streamlit as st
 import math
 
+from calc_engine import basic_eval
+
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(page_title="Casio fx-991 Scientific Calculator", page_icon="🧮", layout="centered")
 
@@ -65,7 +67,7 @@ def press(key):
         st.session_state.expression = ""
     elif key == "=":
         try:
-            result = eval(st.session_state.expression, {"__builtins__": None}, math.__dict__)
+            result = basic_eval(st.session_state.expression)
             st.session_state.expression = str(result)
         except Exception:
             st.session_state.expression = "Error"
@@ -0,0 +1,77 @@
+import math
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+# Points per series sent to the browser: about one per horizontal pixel
+DEFAULT_WIDTH_PX = 1200
+# Series longer than this (before downsampling) are drawn with WebGL (Scattergl)
+WEBGL_THRESHOLD = 5000
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling of one series.
+
+    Keeps the first and last points and, from each of n_out - 2 buckets,
+    the point forming the largest triangle with the previously kept point
+    and the next bucket's average, which preserves peaks and troughs.
+    Returns (x, y) with at most n_out points.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n <= 2:
+        return x, y
+    if n_out < 3:
+        return x[[0, -1]], y[[0, -1]]
+
+    every = (n - 2) / (n_out - 2)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+
+def line_figure(x, series, title=None, width_px=DEFAULT_WIDTH_PX,
+                webgl_threshold=WEBGL_THRESHOLD, x_title=None, y_title=None):
+    """Line chart of {name: values} over `x`, sized for the browser.
+
+    Each series is downsampled server-side to about `width_px` points.
+    Series of more than `webgl_threshold` points (counted before
+    downsampling) use Scattergl, so a very long series stays on WebGL
+    whatever the width.
+    """
+    fig = go.Figure()
+    for name, values in series.items():
+        xs, ys = lttb(x, values, width_px) if width_px else (np.asarray(x), np.asarray(values))
+        trace = go.Scattergl if len(values) > webgl_threshold else go.Scatter
+        fig.add_trace(trace(x=xs, y=ys, mode="lines", name=name))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title,
+                      showlegend=len(series) > 1)
+    return fig
+
+
+def paginated_dataframe(df, key, page_size=60):
+    """Show `df` one page at a time so a rerun only ships page_size rows."""
+    pages = max(1, math.ceil(len(df) / page_size))
+    if pages > 1:
+        page = st.number_input(f"Page (1–{pages})", 1, pages, 1, key=f"{key}-page")
+    else:
+        page = 1
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], use_container_width=True)
+    st.caption(f"Rows {start + 1:,}–{min(start + page_size, len(df)):,} of {len(df):,}")
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+# Columnar .npy copies of the source files; override with RBI_DATA_CACHE
+CACHE_DIR = os.environ.get("RBI_DATA_CACHE", os.path.join(DATA_DIR, ".cache"))
+
+_build_lock = threading.Lock()
+
+
+class Dataset:
+    """Read-only columnar series: column name -> memory-mapped NumPy array."""
+
+    def __init__(self, name, columns):
+        self.name = name
+        self.columns = columns
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def keys(self):
+        return list(self.columns)
+
+    def to_frame(self, columns=None):
+        """pandas view for plotting; numeric columns are not copied."""
+        import pandas as pd
+
+        names = columns or self.keys()
+        return pd.DataFrame({c: self.columns[c] for c in names}, copy=False)
+
+
+def yoy(values, periods=1):
+    """Year-on-year % change, like pandas pct_change(periods) * 100."""
+    values = np.asarray(values, dtype=float)
+    out = np.full(values.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[periods:] = (values[periods:] / values[:-periods] - 1) * 100
+    return out
+
+
+def periods_per_year(columns):
+    """1 for annual data (a Year column), 12 for monthly dates, etc."""
+    if "Date" not in columns:
+        return 1
+    dates = np.asarray(columns["Date"], dtype="datetime64[D]")
+    if len(dates) < 2:
+        return 1
+    step_days = np.median(np.diff(dates).astype(float))
+    return max(1, int(round(365.25 / step_days)))
+
+
+def _source_path(name):
+    for ext in (".parquet", ".csv"):
+        path = os.path.join(DATA_DIR, name + ext)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No data file for '{name}' in {DATA_DIR}")
+
+
+def _read_source(path):
+    import pandas as pd
+
+    df = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+    columns = {}
+    for c in df.columns:
+        if c == "Date":
+            columns[c] = pd.to_datetime(df[c]).to_numpy(dtype="datetime64[ns]")
+        elif pd.api.types.is_string_dtype(df[c]) or df[c].dtype == object:
+            # fixed-width strings can be memory-mapped, Python objects cannot
+            columns[c] = df[c].astype(str).to_numpy(dtype=str)
+        else:
+            columns[c] = df[c].to_numpy()
+    return columns
+
+
+def _cache_path(name, source, derived):
+    """Cache directory for this exact source file and derived-column spec."""
+    stat = os.stat(source)
+    spec = json.dumps([source, stat.st_mtime_ns, stat.st_size, sorted(derived.items())])
+    return os.path.join(CACHE_DIR, f"{name}-{hashlib.sha1(spec.encode()).hexdigest()[:16]}")
+
+
+def _build(name, source, derived, target):
+    columns = _read_source(source)
+    periods = periods_per_year(columns)
+    for new_column, base_column in derived.items():
+        columns[new_column] = yoy(columns[base_column], periods)
+
+    # write to a temp dir, then rename, so readers never see a partial cache
+    tmp = f"{target}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    for i, values in enumerate(columns.values()):
+        np.save(os.path.join(tmp, f"{i}.npy"), values)
+    with open(os.path.join(tmp, "manifest.json"), "w") as f:
+        json.dump({"name": name, "source": source, "columns": list(columns)}, f)
+    try:
+        os.replace(tmp, target)
+    except OSError:
+        # another process built it first
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def load(name, yoy_columns=None):
+    """Load data/<name>.parquet|csv as a memory-mapped Dataset.
+
+    `yoy_columns` maps new column -> base column, e.g. {"Inflation": "CPI"};
+    those YoY columns are computed once, when the cache is built, and
+    stored next to the source columns.
+    """
+    derived = dict(yoy_columns or {})
+    source = _source_path(name)
+    target = _cache_path(name, source, derived)
+
+    manifest = os.path.join(target, "manifest.json")
+    if not os.path.exists(manifest):
+        with _build_lock:
+            if not os.path.exists(manifest):
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                _build(name, source, derived, target)
+
+    with open(manifest) as f:
+        names = json.load(f)["columns"]
+    columns = {
+        column: np.load(os.path.join(target, f"{i}.npy"), mmap_mode="r")
+        for i, column in enumerate(names)
+    }
+    return Dataset(name, columns)
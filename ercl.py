@@ -1,6 +1,8 @@
 import streamlit as st
 import math
 
+from expr_parser import evaluate
+
 # --- PAGE CONFIG ---
 st.set_page_config(page_title="Casio fx-991 Streamlit", page_icon="🧮", layout="centered")
 
@@ -86,17 +88,7 @@ if "mode" not in st.session_state:
 # --- CALCULATOR LOGIC ---
 def safe_eval(expr):
     try:
-        expr = expr.replace("^", "**").replace("√", "math.sqrt")
-        expr = expr.replace("π", str(math.pi)).replace("e", str(math.e))
-        if st.session_state.mode == "DEG":
-            expr = expr.replace("sin(", "math.sin(math.radians(")
-            expr = expr.replace("cos(", "math.cos(math.radians(")
-            expr = expr.replace("tan(", "math.tan(math.radians(")
-        else:
-            expr = expr.replace("sin(", "math.sin(")
-            expr = expr.replace("cos(", "math.cos(")
-            expr = expr.replace("tan(", "math.tan(")
-        return eval(expr, {"__builtins__": None}, math.__dict__)
+        return evaluate(expr, st.session_state.mode)
     except:
         return "Error"
 
@@ -0,0 +1,245 @@
+"""Single-pass tokenizer and operator-precedence parser for calculator expressions.
+
+    evaluate("2sin(30)+√(16)-1e5/π", "DEG")
+
+tokenize() scans the input once with one regular expression; parse()
+turns the tokens into a flat RPN program in one pass (a loop with an
+explicit operator stack, shunting-yard style, so no recursion) and caches
+it per (expression, mode); run() executes the program on a value stack.
+All three are linear in the input length, and no token is ever rewritten,
+so `e` only means Euler's number when it stands alone (`sec`, `1e5` are
+safe).
+
+Grammar, loosest to tightest binding:
+
+    + -                 binary
+    * / % //            binary, and implicit multiplication: 2π, 3(4+1), 2sin(30)
+    - + √               prefix (so -2^2 = -4, like Python)
+    ^ **                power, right-associative
+    !                   postfix factorial
+    name(args)          functions and constants of calc_engine.NAMES[mode]
+
+ercl.py's old evaluator ran over the math module, where log() is the natural
+log (with an optional base: log(8, 2) = 3). ercl keeps that meaning here, so
+log differs from the other calculators' log10; ln is the same function.
+Two other differences from the old evaluator, both from using
+calc_engine's names instead of the whole math module: asin, acos and atan
+return degrees in DEG mode (they returned radians), and names outside
+calc_engine.NAMES (exp, floor, gcd, ...) are a NameError. ercl's keypad
+types none of them; they show in calc_cli --engine pratt.
+"""
+import math
+import operator
+import re
+from functools import lru_cache
+from operator import length_hint
+
+from calc_engine import NAMES, checked_pow
+
+# One alternation without groups: findall() then returns the token strings
+# themselves and skips whitespace (the only thing nothing here matches).
+# Single-character operators come first: they are most of the tokens.
+_TOKEN_RE = re.compile(r"\*\*|//|[-+*/()%,]|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|[A-Za-z_]+|\S")
+
+# Calculator glyphs (− × ÷ ^ π) are tokens of their own, so they sit in
+# these tables next to their ASCII spelling instead of being rewritten
+_BINARY = {
+    "+": (10, operator.add),
+    "-": (10, operator.sub), "−": (10, operator.sub),
+    "*": (20, operator.mul), "×": (20, operator.mul),
+    "/": (20, operator.truediv), "÷": (20, operator.truediv),
+    "%": (20, operator.mod),
+    "//": (20, operator.floordiv),
+    "**": (40, checked_pow), "^": (40, checked_pow),
+}
+_PREFIX = {"-": operator.neg, "−": operator.neg, "+": operator.pos, "√": math.sqrt}
+_PREFIX_BP = 30
+_MUL_BP = _BINARY["*"][0]
+
+# Operator stack entries are (binding power, instruction), built once here
+# so the parser allocates nothing per operator. A binary operator pops
+# every entry whose power is at least its limit: its own power, plus one
+# for the right-associative power operator (2^3^2 = 2^9).
+_BINARY_ENTRIES = {
+    op: (bp + 1 if fn is checked_pow else bp, (bp, (fn, 2))) for op, (bp, fn) in _BINARY.items()
+}
+_PREFIX_ENTRIES = {op: (_PREFIX_BP, (fn, 1)) for op, fn in _PREFIX.items()}
+_MUL_ENTRY = (_MUL_BP, (operator.mul, 2))
+_PAREN = (-1, None)  # "(": never popped by an operator
+_CALL = -2  # "name(" entries: [_CALL, function, commas so far]
+_BOTTOM = (-3, None)  # below everything: a ")" that reaches it is unmatched
+_NAME_START = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_π")
+_NUM_START = set("0123456789.")
+# Tokens that start an implicitly multiplied operand after an operand:
+# 2π, 3(4+1), 2sin(30), 2√9 (names are checked by their first character)
+_IMPLICIT = {"(", "√"}
+
+# calc_engine's names with ercl's natural log(), and π for pi
+ERCL_NAMES = {mode: {**names, "log": math.log, "π": names["pi"]} for mode, names in NAMES.items()}
+
+
+def tokenize(expr: str):
+    """Token strings of `expr` ("2π^2" -> ["2", "π", "^", "2"])."""
+    return _TOKEN_RE.findall(expr)
+
+
+def _position(expr, index):
+    """Character offset of token `index` (None past the end); errors only."""
+    for k, m in enumerate(_TOKEN_RE.finditer(expr)):
+        if k == index:
+            return m.start()
+    return None
+
+
+def _compile(expr, names):
+    """Operator-precedence parser emitting (fn, arg) instructions in postfix order.
+
+    (None, value) pushes a value; (fn, n) pops n values and pushes fn(*values).
+    One loop over the tokens with an explicit operator stack: no recursion
+    and no function call per token, which keeps a one-off parse cheap.
+    """
+    tokens = tokenize(expr)
+    code = []
+    emit = code.append
+    stack = [_BOTTOM]
+    push, pop = stack.append, stack.pop
+    binary, prefix = _BINARY_ENTRIES, _PREFIX_ENTRIES
+    num_start, name_start = _NUM_START, _NAME_START
+    values = {}  # push instruction of each number and constant token, shared by repeats
+    operand = True  # an operand (or prefix operator) comes next
+    n = len(tokens)
+    it = iter(tokens)
+
+    def index():
+        """Index of the token just taken from `it`."""
+        return n - length_hint(it) - 1
+
+    def error(message, index):
+        pos = _position(expr, index)
+        return SyntaxError(f"{message} at {pos}" if pos is not None else f"{message} at end")
+
+    def unexpected(index):
+        if index >= n:
+            return SyntaxError("Unexpected end of expression")
+        return error(f"Unexpected {tokens[index]!r}", index)
+
+    for token in it:
+        if not operand:
+            entry = binary.get(token)
+            if entry is not None:
+                limit, entry = entry
+                while stack[-1][0] >= limit:
+                    emit(pop()[1])
+                push(entry)
+                operand = True
+                continue
+            if token == ")":
+                while stack[-1][0] >= 0:
+                    emit(pop()[1])
+                top = pop()
+                if top[0] == _CALL:
+                    emit((top[1], top[2] + 1))
+                elif top is _BOTTOM:
+                    raise unexpected(index())
+                continue
+            if token == ",":
+                while stack[-1][0] >= 0:
+                    emit(pop()[1])
+                if stack[-1][0] != _CALL:
+                    raise unexpected(index())
+                stack[-1][2] += 1
+                operand = True
+                continue
+            if token == "!":
+                emit((names["factorial"], 1))
+                continue
+            if token in _IMPLICIT or token[0] in name_start:
+                # implicit multiplication: the token starts the right operand
+                while stack[-1][0] >= _MUL_BP:
+                    emit(pop()[1])
+                push(_MUL_ENTRY)
+                # then parse the token as that operand
+            else:
+                raise unexpected(index())
+
+        # operand or prefix operator
+        push_value = values.get(token)
+        if push_value is not None:  # a number or constant seen before
+            emit(push_value)
+            operand = False
+            continue
+        first = token[0]
+        if first in num_start:
+            try:
+                push_value = values[token] = (None, int(token) if token.isdigit() else float(token))
+            except ValueError:  # a lone "."
+                raise unexpected(index()) from None
+            emit(push_value)
+            operand = False
+        elif first in name_start:
+            value = names.get(token)
+            if value is None:
+                raise NameError(f"Unknown identifier '{token}'")
+            if callable(value):
+                follow = next(it, None)
+                if follow != "(":
+                    raise error("Expected '('", n if follow is None else index())
+                push([_CALL, value, 0])
+                operand = True
+            else:
+                push_value = values[token] = (None, value)
+                emit(push_value)
+                operand = False
+        elif token == "(":
+            push(_PAREN)
+            operand = True
+        elif token == ")" and stack[-1][0] == _CALL and not stack[-1][2]:
+            top = pop()  # name() with no arguments
+            emit((top[1], 0))
+            operand = False
+        else:
+            entry = prefix.get(token)
+            if entry is None:
+                raise unexpected(index())
+            push(entry)
+            operand = True
+
+    if operand:
+        raise unexpected(n)
+    while len(stack) > 1:
+        top = pop()
+        if top[0] < 0:
+            raise error("Expected ')'", n)
+        emit(top[1])
+    return tuple(code)
+
+
+@lru_cache(maxsize=1024)
+def parse(expr: str, mode: str):
+    """Compile `expr` into an RPN program (a tuple), once per (expr, mode)."""
+    return _compile(expr, ERCL_NAMES[mode])
+
+
+def run(code):
+    """Execute an RPN program from parse()."""
+    stack = []
+    push = stack.append
+    for fn, arg in code:
+        if fn is None:
+            push(arg)
+        elif arg == 1:
+            stack[-1] = fn(stack[-1])
+        elif arg == 2:
+            right = stack.pop()
+            stack[-1] = fn(stack[-1], right)
+        else:
+            args = stack[len(stack) - arg:]
+            del stack[len(stack) - arg:]
+            push(fn(*args))
+    return stack[-1]
+
+
+def evaluate(expr: str, mode: str):
+    if not expr or expr.isspace():
+        raise ValueError("Empty expression")
+    return run(parse(expr, mode))
@@ -0,0 +1,121 @@
+"""Batched least-squares ARIMA-style forecasts in pure NumPy.
+
+Fits one (p, d, q) order on many equal-length series in a single
+vectorized call: difference, build the lagged design tensor
+(series x rows x regressors), and solve all the normal equations together.
+MA terms use the Hannan-Rissanen two-stage method: a long AR fit supplies
+residuals, which then join the regression as lagged regressors. A
+constant is included only when d == 0, following statsmodels' ARIMA.
+
+No statsmodels import, so this is the default forecaster for the
+dashboard; see forecast_models for the statsmodels ("precise") candidates.
+"""
+import itertools
+
+import numpy as np
+
+# The same order grid that forecast_models searches with statsmodels
+ORDERS = list(itertools.product(range(3), range(2), range(2)))
+
+
+def aicc(llf, nobs, k, n):
+    """AICc of fits whose log-likelihood `llf` covers `nobs` of the `n` points.
+
+    The log-likelihood is scaled to the full length so fits that condition
+    on different numbers of points compare fairly; inf when the model has
+    too many parameters for the series to judge it. Works element-wise.
+    """
+    llf, nobs = np.asarray(llf, dtype=float), np.asarray(nobs, dtype=float)
+    penalty = 2 * k + 2 * k * (k + 1) / max(n - k - 1, 1)
+    return np.where(n - k - 1 > 0, -2 * llf * n / nobs + penalty, np.inf)
+
+
+def _lags(y, start, count):
+    """Columns y[t - 1], ..., y[t - count] for the rows t = start .. end."""
+    return [y[:, start - k:y.shape[1] - k] for k in range(1, count + 1)]
+
+
+def _solve(X, y):
+    """Least squares for every series at once: X (S, n, k), y (S, n) -> (S, k)."""
+    if X.shape[2] == 0:
+        return np.zeros(X.shape[:1] + (0,))
+    XtX = np.einsum("snk,snj->skj", X, X)
+    Xty = np.einsum("snk,sn->sk", X, y)
+    # a tiny ridge keeps flat series (singular X'X) solvable
+    ridge = 1e-10 * np.trace(XtX, axis1=1, axis2=2)[:, None, None] + 1e-12
+    return np.linalg.solve(XtX + ridge * np.eye(X.shape[2]), Xty[..., None])[..., 0]
+
+
+def fit_batch(Y, order=(1, 1, 1), steps=1):
+    """Fit ARIMA-style `order` on every row of Y (series x time).
+
+    Returns (aicc, forecasts): arrays of shape (S,) and (S, steps). Rows
+    too short for the order get an inf AICc and nan forecasts.
+    """
+    p, d, q = order
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    S, T = Y.shape
+    y = np.diff(Y, d, axis=1)
+    L = y.shape[1]
+    const = d == 0
+
+    # stage 1 (MA only): a long AR(m) gives the residual estimates
+    m = max(p, q) + 2 if q else 0
+    start = max(p, m + q)
+    n = L - start
+    k = p + q + const + 1  # regressors + variance
+    if n <= k or (q and L - m <= m + 1):
+        return np.full(S, np.inf), np.full((S, steps), np.nan)
+
+    if q:
+        X1 = np.stack([np.ones((S, L - m))] + _lags(y, m, m), axis=2)
+        e = y[:, m:] - np.einsum("snk,sk->sn", X1, _solve(X1, y[:, m:]))
+
+    # stage 2: y_t on [1], y_{t-1..p}, e_{t-1..q}
+    columns = [np.ones((S, n))] if const else []
+    columns += _lags(y, start, p)
+    if q:
+        columns += [e[:, start - m - j:L - m - j] for j in range(1, q + 1)]
+    X = np.stack(columns, axis=2) if columns else np.zeros((S, n, 0))
+    target = y[:, start:]
+    beta = _solve(X, target)
+    resid = target - np.einsum("snk,sk->sn", X, beta)
+
+    sigma2 = np.maximum(np.mean(resid ** 2, axis=1), 1e-12)
+    llf = -0.5 * n * (np.log(2 * np.pi * sigma2) + 1)
+    score = aicc(llf, n, k, T)
+
+    # recursive forecast on the differenced scale, future shocks = 0
+    c = beta[:, 0] if const else np.zeros(S)
+    phi = beta[:, const:const + p]
+    theta = beta[:, const + p:]
+    history = y[:, L - p:][:, ::-1] if p else np.zeros((S, 0))  # newest first
+    shocks = resid[:, n - q:][:, ::-1] if q else np.zeros((S, 0))
+    forecast = np.empty((S, steps))
+    for h in range(steps):
+        forecast[:, h] = c + np.sum(phi * history, axis=1) + np.sum(theta * shocks, axis=1)
+        history = np.column_stack([forecast[:, h], history[:, :-1]])[:, :p]
+        shocks = np.column_stack([np.zeros(S), shocks[:, :-1]])[:, :q]
+
+    # undo the differencing
+    for i in range(d, 0, -1):
+        forecast = np.diff(Y, i - 1, axis=1)[:, -1:] + np.cumsum(forecast, axis=1)
+    return score, forecast
+
+
+def forecast_batch(Y, steps=1, orders=ORDERS):
+    """Best order per row of Y (lowest AICc) and its forecasts.
+
+    Returns (forecasts (S, steps), order index (S,), aicc (S,)); the index
+    is -1 (and the forecasts nan) for rows no order could be fitted on.
+    """
+    fits = [fit_batch(Y, order, steps) for order in orders]
+    scores = np.stack([f[0] for f in fits])  # (orders, S)
+    forecasts = np.stack([f[1] for f in fits])  # (orders, S, steps)
+    scores = np.where(np.isfinite(scores) & np.isfinite(forecasts).all(axis=2), scores, np.inf)
+
+    best = np.argmin(scores, axis=0)
+    rows = np.arange(scores.shape[1])
+    found = np.isfinite(scores[best, rows])
+    return (np.where(found[:, None], forecasts[best, rows], np.nan),
+            np.where(found, best, -1), scores[best, rows])
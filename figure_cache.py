@@ -0,0 +1,153 @@
+"""Plotly figures built once per server, not once per session.
+
+    fig = cached_figure(px.line, cpi, x="Year", y="CPI", title="USA CPI Index")
+    st.plotly_chart(fig, use_container_width=True)
+
+cached_figure() keys a figure by its builder, a hash of the input data and
+the chart parameters, and keeps the serialized figure JSON in one
+FigureCache shared by every session (st.cache_resource). A hit only parses
+the JSON back into a Figure without re-validating it, about 2 ms against
+40+ ms to build a px figure. Each caller gets its own Figure, so updating
+one never touches another session's chart.
+"""
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from profiling import section
+
+# Memory cap for the shared cache; override with RBI_FIGURE_CACHE_MB
+DEFAULT_MAX_MB = float(os.environ.get("RBI_FIGURE_CACHE_MB", 64))
+
+
+def data_hash(data, digest=None):
+    """SHA-256 of DataFrames, Series, arrays and (nested) dicts/lists of them."""
+    import pandas as pd
+
+    top = digest is None
+    digest = digest or hashlib.sha256()
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        digest.update(repr(list(data.columns) if isinstance(data, pd.DataFrame) else data.name).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, np.ndarray):
+        digest.update(f"{data.dtype}{data.shape}".encode())
+        digest.update(np.ascontiguousarray(data).tobytes())
+    elif isinstance(data, dict):
+        for k in sorted(data, key=repr):
+            digest.update(repr(k).encode())
+            data_hash(data[k], digest)
+    elif isinstance(data, (list, tuple)):
+        digest.update(f"{type(data).__name__}{len(data)}".encode())
+        for item in data:
+            data_hash(item, digest)
+    else:
+        digest.update(repr(data).encode())
+    return digest.hexdigest() if top else digest
+
+
+class FigureCache:
+    """LRU cache of serialized figures, bounded by their total size in memory.
+
+    get_or_build() builds a missing figure only once even when several
+    sessions ask for it at the same time: the others wait for that build.
+    """
+
+    def __init__(self, max_bytes=int(DEFAULT_MAX_MB * 2 ** 20)):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = self.misses = 0
+        self._specs = OrderedDict()
+        self._lock = threading.Lock()
+        self._building = {}  # key -> lock held while that figure is built
+
+    def __len__(self):
+        return len(self._specs)
+
+    def get(self, key):
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is not None:
+                self._specs.move_to_end(key)
+            return spec
+
+    def put(self, key, spec):
+        size = sys.getsizeof(spec)
+        if size > self.max_bytes:
+            return  # larger than the whole cache: serve it, don't keep it
+        with self._lock:
+            if key in self._specs:
+                self.size -= sys.getsizeof(self._specs.pop(key))
+            self._specs[key] = spec
+            self.size += size
+            while self.size > self.max_bytes:
+                _, old = self._specs.popitem(last=False)
+                self.size -= sys.getsizeof(old)
+
+    def get_or_build(self, key, build):
+        """Figure for `key`, calling build() -> go.Figure only on a miss."""
+        while True:
+            with self._lock:
+                spec = self._specs.get(key)
+                if spec is not None:
+                    self._specs.move_to_end(key)
+                    self.hits += 1
+                    break
+                building = self._building.get(key)
+                if building is None:  # we build it; later callers wait on our lock
+                    building = self._building[key] = threading.Lock()
+                    building.acquire()
+                    self.misses += 1
+                    owner = True
+                else:
+                    owner = False
+            if not owner:
+                with building:  # wait for that build, then look again
+                    pass
+                continue
+            try:
+                with section("figure build"):
+                    spec = build().to_json()
+                self.put(key, spec)
+            finally:
+                # only the builder removes its entry, so a waiter that wakes up
+                # late can never drop the lock of a newer build of the same key
+                with self._lock:
+                    del self._building[key]
+                building.release()
+            break
+        # the JSON came from a validated figure; skip plotly's validation pass
+        with section("figure from JSON"):
+            return go.Figure(json.loads(spec), _validate=False)
+
+    def clear(self):
+        with self._lock:
+            self._specs.clear()
+            self.size = 0
+
+
+@st.cache_resource
+def shared_cache():
+    """The FigureCache shared by every session of this server."""
+    return FigureCache()
+
+
+def cached_figure(build, *data, **params):
+    """build(*data, **params) through the shared cache.
+
+    `data` is hashed by value; `params` must have stable reprs (strings,
+    numbers, lists of them).
+    """
+    with section("figure hash"):
+        key = "|".join([
+            f"{build.__module__}.{build.__qualname__}",
+            data_hash(list(data)),
+            repr(sorted(params.items())),
+        ])
+    return shared_cache().get_or_build(key, lambda: build(*data, **params))
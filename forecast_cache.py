@@ -0,0 +1,74 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def series_key(series, order):
+    """Stable cache key: hash of the series values plus the model order."""
+    values = np.ascontiguousarray(np.asarray(series, dtype=float))
+    digest = hashlib.sha256(values.tobytes())
+    digest.update(repr(tuple(order)).encode())
+    return digest.hexdigest()
+
+
+class ModelCache:
+    """Size-bounded LRU cache of fitted models with an optional disk layer.
+
+    Entries live in memory (least recently used evicted first once
+    `max_size` is reached). When `disk_dir` is set, fitted models are also
+    pickled there so they survive a server restart.
+    """
+
+    def __init__(self, max_size=256, disk_dir=None):
+        self.max_size = max_size
+        self.disk_dir = disk_dir
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._models)
+
+    def _path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.pkl")
+
+    def get(self, key):
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+
+        if self.disk_dir and os.path.exists(self._path(key)):
+            try:
+                with open(self._path(key), "rb") as f:
+                    model = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                return None
+            self._remember(key, model)
+            return model
+        return None
+
+    def put(self, key, model):
+        self._remember(key, model)
+        if self.disk_dir:
+            # write then rename so a concurrent reader never sees half a file
+            tmp = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(model, f)
+            os.replace(tmp, self._path(key))
+
+    def _remember(self, key, model):
+        with self._lock:
+            self._models[key] = model
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
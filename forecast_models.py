@@ -0,0 +1,144 @@
+"""Candidate forecasting models and per-series model selection.
+
+A candidate is a small tuple naming a model family and its settings:
+
+    ("arima", (p, d, q))   statsmodels ARIMA
+    ("ets", trend)         statsmodels ETS with additive errors, trend None or "add"
+    ("fast", (p, d, q))    least-squares ARIMA-style fit from fast_forecast (NumPy only)
+
+fit_candidates() fits a group of candidates on one series and is the unit
+of work sent to the process pool (see forecast_service.select_many);
+select() keeps the fit with the lowest AICc. select_fast() runs only the
+"fast" family, vectorized over every series at once, and is what the
+dashboard uses unless precise (statsmodels) mode is on. default_candidates()
+includes the "fast" family only when statsmodels is missing: conditional
+least-squares likelihoods are not comparable with statsmodels' exact ones,
+so in one AICc contest the least-squares fits would always win.
+
+The families condition on different numbers of observations (an AR(3) on
+the differenced series only scores n - 4 points), so every log-likelihood
+is scaled to the full series length before the AICc penalty is added
+(fast_forecast.aicc). Otherwise high-order least-squares fits win simply by
+scoring fewer points.
+"""
+import itertools
+import warnings
+from collections import namedtuple
+from importlib.util import find_spec
+
+import numpy as np
+
+from fast_forecast import ORDERS, aicc, fit_batch, forecast_batch
+
+# statsmodels is optional: without it only the least-squares candidates run
+HAS_STATSMODELS = find_spec("statsmodels") is not None
+
+# Chosen model for one series: the candidate, its label, AICc and `steps` forecasts
+Forecast = namedtuple("Forecast", "candidate label aicc values")
+
+
+def default_candidates(max_p=2, max_d=1, max_q=1):
+    """Every candidate worth trying on a short annual series."""
+    orders = list(itertools.product(range(max_p + 1), range(max_d + 1), range(max_q + 1)))
+    candidates = []
+    if HAS_STATSMODELS:
+        candidates += [("arima", order) for order in orders]
+        candidates += [("ets", None), ("ets", "add")]
+    else:
+        candidates += [("fast", order) for order in orders]
+    return candidates
+
+
+def label(candidate):
+    kind, spec = candidate
+    if kind == "arima":
+        return "ARIMA({},{},{})".format(*spec)
+    if kind == "ets":
+        return "ETS(A,A)" if spec == "add" else "ETS(A,N)"
+    return "ARIMA({},{},{}) (least squares)".format(*spec)
+
+
+# -----------------------------------------------------------
+#                 STATSMODELS CANDIDATES
+# -----------------------------------------------------------
+def _fit_arima(values, order, steps):
+    from statsmodels.tsa.arima.model import ARIMA
+
+    with warnings.catch_warnings():
+        # after the import: statsmodels installs its own warning filters on import
+        warnings.simplefilter("ignore")
+        res = ARIMA(values, order=order).fit()
+    score = aicc(res.llf, res.nobs - res.loglikelihood_burn, len(res.params), len(values))
+    return score, np.asarray(res.forecast(steps))
+
+
+def _fit_ets(values, trend, steps):
+    from statsmodels.tsa.exponential_smoothing.ets import ETSModel
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res = ETSModel(values, error="add", trend=trend).fit(disp=False)
+    return aicc(res.llf, res.nobs, res.df_model, len(values)), np.asarray(res.forecast(steps))
+
+
+def fit_candidates(values, candidates, steps):
+    """Fit each candidate on one series.
+
+    Returns [(candidate, aicc, forecast, error)]; a failing candidate gets
+    error set instead of stopping the rest.
+    """
+    values = np.asarray(values, dtype=float)
+
+    results = []
+    for candidate in candidates:
+        kind, spec = candidate
+        try:
+            if kind == "arima":
+                score, forecast = _fit_arima(values, spec, steps)
+            elif kind == "ets":
+                score, forecast = _fit_ets(values, spec, steps)
+            elif kind == "fast":
+                scores, forecasts = fit_batch(values, spec, steps)
+                score, forecast = scores[0], forecasts[0]
+            else:
+                raise ValueError(f"unknown model family '{kind}'")
+        except Exception as e:
+            results.append((candidate, np.nan, None, str(e)))
+            continue
+        results.append((candidate, float(score), forecast, None))
+    return results
+
+
+def select(results):
+    """The Forecast with the lowest finite AICc out of fit_candidates() results
+    (in candidate order: the first of tied scores wins)."""
+    fitted = [r for r in results if r[3] is None and np.isfinite(r[1]) and np.all(np.isfinite(r[2]))]
+    if not fitted:
+        errors = "; ".join(f"{label(c)}: {e}" for c, _, _, e in results if e)
+        raise ValueError(f"no candidate model could be fitted ({errors or 'no candidates'})")
+    # min() keeps the first of equal scores, so ties go to the earlier candidate
+    candidate, score, forecast, _ = min(fitted, key=lambda r: r[1])
+    return Forecast(candidate, label(candidate), score, forecast)
+
+
+def select_fast(series_by_name, steps=1, orders=ORDERS):
+    """Best least-squares order (lowest AICc) for many series, vectorized.
+
+    Returns [(name, Forecast, error)] in input order. Series of the same
+    length are fitted together in one fast_forecast.forecast_batch() call.
+    """
+    by_length = {}
+    for name, series in series_by_name.items():
+        by_length.setdefault(len(series), []).append(name)
+
+    results = {}
+    for names in by_length.values():
+        Y = np.array([np.asarray(series_by_name[name], dtype=float) for name in names])
+        forecasts, best, scores = forecast_batch(Y, steps, orders)
+        for name, values, index, score in zip(names, forecasts, best, scores):
+            if index < 0:
+                results[name] = (None, ValueError("series too short for any forecast model"))
+            else:
+                candidate = ("fast", tuple(orders[index]))
+                results[name] = (Forecast(candidate, label(candidate), float(score), values), None)
+    return [(name, *results[name]) for name in series_by_name]
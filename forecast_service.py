@@ -0,0 +1,238 @@
+import atexit
+import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+from forecast_cache import series_key
+from forecast_models import default_candidates, fit_candidates, select
+from pipe_worker import Worker
+
+# Worker count for the shared pool; override with RBI_FORECAST_WORKERS
+DEFAULT_WORKERS = int(os.environ.get("RBI_FORECAST_WORKERS", 0)) or os.cpu_count() or 1
+
+_executor = None
+_executor_workers = None
+_executor_lock = threading.Lock()
+
+
+class WorkerPool:
+    """Executor running functions in up to `max_workers` pipe_worker processes.
+
+    submit() returns a concurrent.futures.Future; a thread per busy worker
+    waits on its pipe. Workers are started on first use and reused; one that
+    dies fails only its own task and is replaced on the next submit.
+    """
+
+    def __init__(self, max_workers):
+        self._threads = ThreadPoolExecutor(max_workers, thread_name_prefix="forecast-worker")
+        self._idle = queue.LifoQueue()
+        self._closed = False
+
+    def submit(self, fn, *args):
+        return self._threads.submit(self._call, fn, args)
+
+    def _call(self, fn, args):
+        try:
+            worker = self._idle.get_nowait()
+        except queue.Empty:
+            worker = Worker(preload=("forecast_models",))
+        try:
+            status, value = worker.call(fn, args)
+        except (EOFError, OSError):
+            worker.kill()
+            raise RuntimeError("Forecast worker exited during the task") from None
+        if self._closed:
+            worker.kill()
+        else:
+            self._idle.put(worker)
+        if status == "error":
+            raise value
+        return value
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """Stop the pool; busy workers are stopped when their task returns."""
+        self._closed = True
+        self._threads.shutdown(wait=wait, cancel_futures=cancel_futures)
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
+
+
+def get_executor(max_workers=None):
+    """Worker pool shared by every caller, (re)created on demand."""
+    global _executor, _executor_workers
+    max_workers = max_workers or DEFAULT_WORKERS
+    with _executor_lock:
+        if _executor is None or _executor_workers != max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = WorkerPool(max_workers)
+            _executor_workers = max_workers
+        return _executor
+
+
+@atexit.register
+def shutdown():
+    """Stop the shared pool (pending fits are cancelled)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def run_tasks(tasks, max_workers=None, cancel=None):
+    """Run {tag: (fn, args)} and yield (tag, result, error) as each finishes.
+
+    Runs inline when there is a single task or a single worker, otherwise
+    on the shared pool. Setting the `cancel` event (threading.Event) stops
+    the run: tasks not yet started are dropped and nothing more is yielded.
+    """
+    cancelled = cancel.is_set if cancel is not None else (lambda: False)
+
+    # a single task (or a 1-worker setting) is cheaper without the pool
+    if len(tasks) <= 1 or (max_workers or DEFAULT_WORKERS) == 1:
+        for tag, (fn, args) in tasks.items():
+            if cancelled():
+                return
+            try:
+                result = fn(*args)
+            except Exception as e:
+                yield tag, None, e
+                continue
+            yield tag, result, None
+        return
+
+    executor = get_executor(max_workers)
+    futures = {executor.submit(fn, *args): tag for tag, (fn, args) in tasks.items()}
+    pending = set(futures)
+    try:
+        while pending and not cancelled():
+            # short timeout so a cancel request is noticed between tasks
+            done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    yield futures[future], None, e
+                    continue
+                yield futures[future], result, None
+    finally:
+        # caller stopped early (e.g. Streamlit rerun): drop tasks not yet started
+        for future in futures:
+            future.cancel()
+
+
+def select_many(series_by_name, steps=1, candidates=None, max_workers=None, cache=None,
+                cancel=None):
+    """Pick and run the best candidate model (lowest AICc) for many series.
+
+    Yields (name, Forecast, error) as each series is decided. The candidate
+    list of every series is split into groups so that the groups of all
+    series together keep the pool busy; each group shares one copy of the
+    prepared series. Decisions found in `cache` are yielded first.
+    See run_tasks() for `cancel`.
+    """
+    candidates = list(candidates or default_candidates())
+    workers = max_workers or DEFAULT_WORKERS
+    # about two groups per worker over all series, at least one candidate each
+    groups = min(len(candidates), max(1, -(-2 * workers // max(1, len(series_by_name)))))
+    size = -(-len(candidates) // groups)
+
+    tasks, keys, parts = {}, {}, {}
+    for name, series in series_by_name.items():
+        values = np.asarray(series, dtype=float)
+        keys[name] = series_key(values, (steps, tuple(candidates)))
+        chosen = cache.get(keys[name]) if cache is not None else None
+        if chosen is not None:
+            yield name, chosen, None
+            continue
+        parts[name] = {}
+        for i in range(0, len(candidates), size):
+            tasks[name, i] = (fit_candidates, (values, candidates[i:i + size], steps))
+
+    remaining = {name: -(-len(candidates) // size) for name in parts}
+    for (name, i), results, error in run_tasks(tasks, max_workers, cancel):
+        if name not in remaining:
+            continue  # series already failed on an earlier group
+        if error is not None:
+            del remaining[name]
+            yield name, None, error
+            continue
+        parts[name][i] = results
+        remaining[name] -= 1
+        if remaining[name]:
+            continue
+        del remaining[name]
+        # groups finish in any order; select() needs candidate order for ties
+        done = parts.pop(name)
+        try:
+            chosen = select([r for start in sorted(done) for r in done[start]])
+        except ValueError as e:
+            yield name, None, e
+            continue
+        if cache is not None:
+            cache.put(keys[name], chosen)
+        yield name, chosen, None
+
+
+class ForecastJob:
+    """select_many() running on a background thread.
+
+    Meant to be kept in a Streamlit session: the page polls `results` and
+    `progress` on each rerun instead of blocking until every fit returns,
+    and calls cancel() when the user stops the job or changes the inputs.
+    """
+
+    def __init__(self, series_by_name, steps=1, candidates=None, max_workers=None, cache=None):
+        candidates = tuple(candidates or default_candidates())
+        self.key = (tuple(series_by_name), steps, candidates)
+        self.steps = steps
+        self.total = len(series_by_name)
+        self.results = {}  # name -> (Forecast, error), in completion order
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(series_by_name, steps, candidates, max_workers, cache),
+            name="forecast-job", daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, series_by_name, steps, candidates, max_workers, cache):
+        results = select_many(series_by_name, steps=steps, candidates=candidates,
+                              max_workers=max_workers, cache=cache, cancel=self._cancel)
+        try:
+            for name, forecast, error in results:
+                with self._lock:
+                    self.results[name] = (forecast, error)
+        except Exception as e:
+            # e.g. the pool could not start; report it against every missing series
+            with self._lock:
+                for name in series_by_name:
+                    self.results.setdefault(name, (None, e))
+
+    def snapshot(self):
+        """List of (name, Forecast, error) finished so far."""
+        with self._lock:
+            return [(name, *result) for name, result in self.results.items()]
+
+    @property
+    def progress(self):
+        return len(self.results) / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        return not self._thread.is_alive()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
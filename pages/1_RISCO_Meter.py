@@ -0,0 +1,101 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from risco import allocation_figure, gauge_figure, update_allocation, update_gauge
+from risk_scoring import get_model, load_models, read_allocations, score_frame
+from profiling import section
+from theme import apply_theme
+
+apply_theme()
+
+# -----------------------------------------------------------
+#                 1️⃣ RISCO METER (ADVANCED)
+# -----------------------------------------------------------
+st.title("📊 RISCO Meter – Advanced Risk Analyzer")
+
+
+@st.fragment
+def risco_meter(model):
+    """Sliders + gauge + pie. A slider move reruns only this fragment,
+    and the two figures are patched in place rather than rebuilt."""
+    st.write("Enter your portfolio allocation (%)")
+
+    # one slider per asset class of the active model
+    values = [
+        st.slider(f"{asset} (%)", 0, 100, default, key=f"risco-{model.name}-{asset}")
+        for asset, default in zip(model.assets, model.defaults)
+    ]
+    total = sum(values)
+
+    if total != 100:
+        st.warning("Total allocation must be 100%.")
+        return
+
+    with section("score"):
+        score = model.score(values)
+        category, color = model.category(score)
+
+    # figures live in the session (per model) and are only updated after the first run
+    with section("figures"):
+        figures = st.session_state.setdefault("risco_figures", {})
+        if model.name not in figures:
+            figures[model.name] = (gauge_figure(score, color, model), allocation_figure(values, model))
+        else:
+            update_gauge(figures[model.name][0], score, color)
+            update_allocation(figures[model.name][1], values)
+        gauge, pie = figures[model.name]
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📌 Risk Gauge")
+        with section("plotly_chart"):
+            st.plotly_chart(gauge, use_container_width=True, key="risco_gauge_chart")
+
+    with col2:
+        st.subheader("📈 Portfolio Allocation")
+        with section("plotly_chart"):
+            st.plotly_chart(pie, use_container_width=True, key="risco_pie_chart")
+
+    st.success(f"Your Risk Category: {category}")
+
+
+# The model picker sits outside the fragment: switching models reruns the
+# whole page, so the meter and the batch upload below use the same model
+models, default = load_models()
+names = list(models)
+try:
+    initial = get_model().name
+except ValueError as e:  # a bad RBI_RISK_MODEL: say so, use the registry default
+    st.error(f"{e}. Using '{default}'.")
+    initial = default
+model = models[st.selectbox("Risk model", names, index=names.index(initial),
+                            format_func=lambda n: models[n].label)]
+
+with section("meter"):
+    risco_meter(model)
+
+
+# Batch mode: score a whole client book (one column per asset class of the selected model)
+count_colors = {**dict(zip(model.categories, model.colors)), "Invalid": "grey"}
+
+st.write("### 📂 Portfolio Book Scoring")
+upload = st.file_uploader(f"Upload allocations (CSV or Parquet; columns: {', '.join(model.columns)})",
+                          type=["csv", "parquet"])
+
+if upload is not None:
+    try:
+        with section("book scoring"):
+            _, counts = score_frame(read_allocations(upload, model), model)
+    except ValueError as e:
+        st.error(f"Could not read allocation file: {e}")
+    else:
+        counts_df = pd.DataFrame({"Category": list(counts), "Portfolios": list(counts.values())})
+        cols = st.columns(len(counts))
+        for col, (category, n) in zip(cols, counts.items()):
+            col.metric(category, f"{n:,}")
+
+        fig = px.bar(counts_df, x="Category", y="Portfolios", title="Portfolios by Risk Category",
+                     color="Category", color_discrete_map=count_colors)
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,76 @@
+import pandas as pd
+import streamlit as st
+
+from amortization import COLUMNS, amortize, load_loans, portfolio_totals
+from charts import line_figure, paginated_dataframe
+from figure_cache import cached_figure
+from profiling import section
+from theme import apply_theme
+
+apply_theme()
+
+# -----------------------------------------------------------
+#          2️⃣ INTEREST RATE CALCULATOR (ADVANCED)
+# -----------------------------------------------------------
+st.title("💰 Interest Rate & EMI Calculator")
+
+principal = st.number_input("Loan Amount (₹)", 1000, 100000000, 100000)
+tenure = st.number_input("Tenure (Months)", 1, 360, 12)
+rate = st.number_input("Interest Rate (% per year)", 0.0, 50.0, 8.0)
+
+# Results stay on screen (e.g. while paging the table) until an input changes
+if st.button("Calculate EMI"):
+    st.session_state.emi_inputs = (principal, rate, tenure)
+
+if st.session_state.get("emi_inputs") == (principal, rate, tenure):
+    with section("amortize"):
+        schedule = amortize(principal, rate, tenure)
+    emi = schedule["EMI"][0]
+
+    st.subheader(f"📌 Monthly EMI: ₹ {emi:,.2f}")
+
+    # Amortization table (closed-form, see amortization.py)
+    st.write("### 📄 Amortization Schedule")
+    with section("schedule table"):
+        df = pd.DataFrame(schedule, columns=COLUMNS)
+        paginated_dataframe(df, key="schedule")
+
+    st.write("### 📈 Loan Balance Over Time")
+    with section("balance chart"):
+        fig = cached_figure(line_figure, schedule["Month"], {"Balance": schedule["Balance"]},
+                            title="Loan Balance Over Time", x_title="Month", y_title="Balance")
+        with section("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(max_entries=4, show_spinner="Computing portfolio totals…")
+def portfolio_summary(file_id, _upload):
+    """Loan count, principal and monthly totals for one uploaded file."""
+    principal, rate, tenure = load_loans(_upload)
+    return len(principal), principal.sum(), pd.DataFrame(portfolio_totals(principal, rate, tenure))
+
+
+# Batch mode: whole loan book from a file (columns: principal, rate, tenure)
+st.write("### 📂 Portfolio Batch Mode")
+upload = st.file_uploader("Upload loan book (CSV or Parquet)", type=["csv", "parquet"])
+
+if upload is not None:
+    try:
+        with section("portfolio totals"):
+            n_loans, total_principal, totals = portfolio_summary(upload.file_id, upload)
+    except ValueError as e:
+        st.error(f"Could not read loan file: {e}")
+    else:
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Loans", f"{n_loans:,}")
+        col2.metric("Total Principal (₹)", f"{total_principal:,.0f}")
+        col3.metric("Total Interest (₹)", f"{totals['Interest'].sum():,.0f}")
+
+        with section("portfolio chart"):
+            fig = cached_figure(line_figure, totals["Month"],
+                                {"Cash Flow": totals["Cash Flow"], "Interest": totals["Interest"]},
+                                title="Portfolio Cash Flow & Interest by Month", x_title="Month")
+            with section("plotly_chart"):
+                st.plotly_chart(fig, use_container_width=True)
+        with section("portfolio table"):
+            paginated_dataframe(totals, key="portfolio")
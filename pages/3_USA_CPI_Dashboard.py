@@ -0,0 +1,40 @@
+import plotly.express as px
+import streamlit as st
+
+import datasets
+from figure_cache import cached_figure
+from profiling import section
+from theme import apply_theme
+
+
+@st.cache_resource
+def load_cpi():
+    """CPI series + YoY inflation, loaded once and shared by all sessions."""
+    return datasets.load("usa_cpi", yoy_columns={"Inflation": "CPI"})
+
+
+apply_theme()
+
+# -----------------------------------------------------------
+#              3️⃣ USA CPI DASHBOARD (ADVANCED)
+# -----------------------------------------------------------
+st.title("🇺🇸 USA CPI Dashboard – Inflation Trends")
+
+# data/usa_cpi.csv (memory-mapped, YoY precomputed - see datasets.py)
+with section("data"):
+    cpi = load_cpi().to_frame()
+
+st.write("### 📈 CPI Trend (USA)")
+# figures are built once per server and shared by every session (figure_cache.py)
+with section("CPI chart"):
+    fig = cached_figure(px.line, cpi, x="Year", y="CPI", markers=True, title="USA CPI Index")
+    with section("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True)
+
+st.write("### 📉 Year-on-Year Inflation")
+with section("YoY chart"):
+    fig2 = cached_figure(px.bar, cpi, x="Year", y="Inflation", title="USA YoY CPI Inflation (%)")
+    with section("plotly_chart"):
+        st.plotly_chart(fig2, use_container_width=True)
+
+st.info("Federal Reserve Inflation Target: *2%*")
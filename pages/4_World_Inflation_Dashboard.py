@@ -0,0 +1,145 @@
+import os
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+import datasets
+from figure_cache import cached_figure
+from forecast_cache import ModelCache
+from forecast_models import HAS_STATSMODELS, select_fast
+from forecast_service import ForecastJob
+from profiling import section
+from theme import apply_theme
+
+
+@st.cache_resource
+def get_model_cache():
+    """Chosen forecast models shared across reruns and sessions.
+
+    Set RBI_MODEL_CACHE_DIR to also keep fits on disk between restarts.
+    """
+    return ModelCache(max_size=256, disk_dir=os.environ.get("RBI_MODEL_CACHE_DIR"))
+
+
+@st.cache_resource
+def load_inflation():
+    """Inflation by country (data/world_inflation.csv), shared by all sessions."""
+    return datasets.load("world_inflation")
+
+
+def forecast_job(series_by_name, steps):
+    """This session's background forecast job for the current selection.
+
+    A new selection or horizon cancels the previous job rather than waiting for it.
+    """
+    job = st.session_state.get("forecast_job")
+    if job is None or job.key[:2] != (tuple(series_by_name), steps):
+        if job is not None:
+            job.cancel()
+        job = ForecastJob(series_by_name, steps=steps, cache=get_model_cache())
+        st.session_state.forecast_job = job
+    return job
+
+
+def show_forecasts(rows, df, steps):
+    """One row per (name, Forecast, error) and a history + forecast chart."""
+    last_year = int(df["Year"].iloc[-1])
+    years = np.arange(last_year + 1, last_year + steps + 1)
+    fig = go.Figure()
+    palette = px.colors.qualitative.Plotly
+    for i, (c, forecast, error) in enumerate(rows):
+        if error is not None:
+            st.error(f"Could not forecast for {c}: {error}")
+            continue
+        text = f"{c} – Forecast Inflation (Next Year, {forecast.label}): {forecast.values[0]:.2f}%"
+        if steps > 1:
+            text += f"; {years[-1]}: {forecast.values[-1]:.2f}%"
+        st.success(text)
+        if steps == 1:
+            continue  # a one-point forecast gets no chart
+
+        # colour set here: plotly only picks trace colours when rendering
+        color = palette[i % len(palette)]
+        fig.add_scatter(x=df["Year"], y=df[c], mode="lines", name=c, legendgroup=c, line=dict(color=color))
+        # dashed continuation from the last observed year, in the country's colour
+        fig.add_scatter(x=np.r_[last_year, years], y=np.r_[df[c].iloc[-1], forecast.values],
+                        mode="lines+markers", line=dict(dash="dash", color=color), name=f"{c} forecast",
+                        legendgroup=c)
+    if fig.data:
+        fig.update_layout(title="Inflation Forecast by Country (%)", xaxis_title="Year")
+        with section("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True)
+
+
+def forecast_results(job, df):
+    """Progress bar plus show_forecasts() for a background (precise) job.
+
+    Run as a fragment that polls the job twice a second while it runs, so
+    results appear as each fit finishes; a final full rerun stops the polling.
+    """
+    if not job.done and not job.cancelled:
+        st.progress(job.progress, text=f"Forecast {len(job.results)} of {job.total} countries…")
+        if st.button("Cancel forecasts"):
+            job.cancel()
+            st.rerun()
+    elif job.cancelled and len(job.results) < job.total:
+        st.info(f"Forecasting cancelled after {len(job.results)} of {job.total} countries.")
+        if st.button("Run forecasts again"):
+            del st.session_state.forecast_job
+            st.rerun()
+
+    show_forecasts(job.snapshot(), df, job.steps)
+
+    if job.done and st.session_state.get("forecast_polling"):
+        st.session_state.forecast_polling = False
+        st.rerun()
+
+
+apply_theme()
+
+# -----------------------------------------------------------
+#    4️⃣ WORLD INFLATION DASHBOARD (ADVANCED + FORECAST)
+# -----------------------------------------------------------
+st.title("🌍 World Inflation Dashboard")
+
+st.write("Select countries to compare:")
+
+with section("data"):
+    inflation = load_inflation()
+    df = inflation.to_frame()
+all_countries = [c for c in inflation.keys() if c != "Year"]
+
+countries = st.multiselect("Countries", all_countries, all_countries[:2])
+
+if countries:
+    st.write("### 📈 Historical Inflation Comparison")
+    with section("history chart"):
+        fig = cached_figure(px.line, df, x="Year", y=countries, title="Inflation Rate by Country (%)")
+        with section("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True)
+
+    st.write("### 🔮 Forecast Inflation")
+    steps = st.slider("Forecast horizon (years)", 1, 10, 1)
+    precise = st.toggle("Precise mode (statsmodels ARIMA + exponential smoothing)",
+                        disabled=not HAS_STATSMODELS,
+                        help=None if HAS_STATSMODELS else "Install 'statsmodels' to enable.")
+    series_by_name = {c: df[c] for c in countries}
+
+    if precise:
+        st.caption("Each country gets the statsmodels ARIMA or exponential smoothing "
+                   "model with the lowest AICc.")
+        # statsmodels fits run in the background; the page renders immediately and
+        # the fragment below fills in each forecast as it finishes
+        with section("forecast (precise)"):
+            job = forecast_job(series_by_name, steps)
+            st.session_state.forecast_polling = not job.done
+            st.fragment(forecast_results, run_every=0.5 if not job.done else None)(job, df)
+    else:
+        st.caption("Each country gets the least-squares ARIMA-style order with the lowest AICc, "
+                   "fitted for all countries at once in NumPy.")
+        with section("forecast"):
+            with section("fit"):
+                rows = select_fast(series_by_name, steps)
+            show_forecasts(rows, df, steps)
@@ -0,0 +1,109 @@
+"""Worker processes that run pickled function calls sent over pipes.
+
+    worker = Worker(preload=("calc_engine",))
+    status, value = worker.call(safe_eval, ("2^10", "DEG"), cpu_seconds=1.0, timeout=1.5)
+
+A worker runs this file: jobs arrive pickled on its stdin as (fn, args,
+cpu_seconds), and each reply goes back pickled on its stdout as ("ok",
+result) or ("error", exception). `fn` must be importable by name, i.e. a
+module-level function of a module on the repo path. Where setitimer
+exists, a job given `cpu_seconds` is stopped with a TimeoutError once it
+has used that much CPU time.
+
+This is a plain subprocess rather than multiprocessing. Streamlit runs the
+page as __main__, so the "spawn" start method would re-run the page in
+every worker, and "fork" can deadlock a threaded server. calc_worker and
+forecast_service both build their pools on Worker.
+"""
+import os
+import pickle
+import queue
+import subprocess
+import sys
+import threading
+
+
+def _over_budget(signum, frame):
+    raise TimeoutError("CPU time budget exceeded")
+
+
+def _serve(jobs, replies):
+    """Worker main loop: run pickled (fn, args, cpu_seconds) jobs, reply with pickled results."""
+    import signal
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl-C is for the server; stdin EOF stops us
+    timer = hasattr(signal, "setitimer")
+    if timer:
+        signal.signal(signal.SIGPROF, _over_budget)
+    while True:
+        try:
+            fn, args, cpu_seconds = pickle.load(jobs)
+        except EOFError:
+            return
+        try:
+            if timer and cpu_seconds:
+                signal.setitimer(signal.ITIMER_PROF, cpu_seconds)
+            try:
+                reply = ("ok", fn(*args))
+            finally:
+                if timer and cpu_seconds:
+                    signal.setitimer(signal.ITIMER_PROF, 0)
+        except Exception as e:
+            reply = ("error", e)
+        try:
+            data = pickle.dumps(reply)
+        except Exception as e:  # an exception or result that doesn't pickle
+            data = pickle.dumps(("error", RuntimeError(f"{type(e).__name__}: {e}")))
+        replies.write(data)
+        replies.flush()
+
+
+class Worker:
+    """One worker process plus a thread reading its replies.
+
+    `preload` names modules the worker imports as it starts, so the first
+    job does not pay for them.
+    """
+
+    def __init__(self, preload=()):
+        self.process = subprocess.Popen([sys.executable, os.path.abspath(__file__), *preload],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        self.replies = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        while True:
+            try:
+                self.replies.put(pickle.load(self.process.stdout))
+            except Exception:  # EOF: the worker exited or was killed
+                self.replies.put(None)
+                return
+
+    def call(self, fn, args, cpu_seconds=None, timeout=None):
+        """(status, value) reply of fn(*args).
+
+        Raises queue.Empty if no reply came within `timeout` seconds,
+        EOFError if the worker died, OSError if its pipe is broken.
+        """
+        self.process.stdin.write(pickle.dumps((fn, args, cpu_seconds)))
+        self.process.stdin.flush()
+        reply = self.replies.get(timeout=timeout)
+        if reply is None:
+            raise EOFError("Worker process exited")
+        return reply
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+        for pipe in (self.process.stdin, self.process.stdout):
+            pipe.close()
+
+
+if __name__ == "__main__":
+    # worker process: jobs on stdin, replies on stdout; prints go to stderr
+    import importlib
+
+    for name in sys.argv[1:]:
+        importlib.import_module(name)
+    replies, sys.stdout = sys.stdout.buffer, sys.stderr
+    _serve(sys.stdin.buffer, replies)
@@ -0,0 +1,110 @@
+"""Named timing sections for page reruns.
+
+    from profiling import section
+
+    with section("data"):
+        df = load_cpi().to_frame()
+
+Sections nest (a section opened inside another is recorded under it) and
+are collected in this module, so a driver running the pages in the same
+process (benchmarks/profile_pages.py, through AppTest) can read them back
+as flame-style reports. Off unless RBI_PROFILE=1 or enable() is called;
+a disabled section() costs one flag check. Only the last MAX_RECORDS
+sections are kept (RBI_PROFILE_RECORDS), so a profiled server that nobody
+calls take() on does not grow without bound.
+"""
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+MAX_RECORDS = int(os.environ.get("RBI_PROFILE_RECORDS", 100_000))
+
+_enabled = os.environ.get("RBI_PROFILE") == "1"
+_records = deque(maxlen=MAX_RECORDS)  # (path tuple, seconds), in completion order; oldest dropped
+_lock = threading.Lock()
+_local = threading.local()  # open sections of the current thread (the script runner's)
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = on
+
+
+def is_enabled():
+    return _enabled
+
+
+@contextmanager
+def section(name):
+    """Time the block as `name`, nested under any section already open."""
+    if not _enabled:
+        yield
+        return
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(name)
+    path = tuple(stack)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        with _lock:
+            _records.append((path, elapsed))
+
+
+def take():
+    """Return and clear everything recorded so far."""
+    with _lock:
+        records = list(_records)
+        _records.clear()
+    return records
+
+
+def totals(records, root=()):
+    """{path: seconds} summed over repeated sections, each path under `root`."""
+    out = defaultdict(float)
+    for path, seconds in records:
+        out[tuple(root) + path] += seconds
+    return dict(out)
+
+
+def self_times(total_by_path):
+    """{path: seconds not spent in a child section}."""
+    own = dict(total_by_path)
+    for path, seconds in total_by_path.items():
+        if len(path) > 1 and path[:-1] in own:
+            own[path[:-1]] -= seconds
+    return own
+
+
+def folded(total_by_path):
+    """Folded stacks ("a;b;c <microseconds>" per line), the input format of
+    flamegraph.pl, speedscope and similar viewers."""
+    return "\n".join(f"{';'.join(path)} {round(seconds * 1e6)}"
+                     for path, seconds in sorted(self_times(total_by_path).items())
+                     if seconds > 0)
+
+
+def tree(total_by_path, width=30):
+    """Indented text flame chart: total ms, share of the root and a bar."""
+    roots = [p for p in total_by_path if len(p) == 1]
+    grand = sum(total_by_path[p] for p in roots) or 1.0
+    lines = []
+
+    def walk(path):
+        seconds = total_by_path[path]
+        bar = "█" * max(1, round(width * seconds / grand)) if seconds > 0 else ""
+        lines.append(f"{'  ' * (len(path) - 1)}{path[-1]:<{34 - 2 * (len(path) - 1)}}"
+                     f"{seconds * 1e3:9.2f} ms {100 * seconds / grand:5.1f}%  {bar}")
+        children = [p for p in total_by_path if len(p) == len(path) + 1 and p[:-1] == path]
+        for child in sorted(children, key=total_by_path.get, reverse=True):
+            walk(child)
+
+    for root in sorted(roots, key=total_by_path.get, reverse=True):
+        walk(root)
+    return "\n".join(lines)
@@ -0,0 +1,45 @@
+import plotly.express as px
+import plotly.graph_objects as go
+
+
+# -----------------------------------------------------------
+#        FIGURES (built once, then updated in place)
+# -----------------------------------------------------------
+def gauge_figure(score, color, model):
+    """Risk gauge with one coloured band per category of `model`."""
+    edges = [0, *model.thresholds.tolist(), 100]
+    return go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=score,
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': color},
+            'steps': [
+                {'range': [lo, hi], 'color': band}
+                for lo, hi, band in zip(edges, edges[1:], model.bands)
+            ],
+        },
+        title={'text': "Overall Risk Score"}
+    ))
+
+
+def allocation_figure(values, model):
+    return px.pie(
+        values=values,
+        names=model.assets,
+        color_discrete_sequence=model.asset_colors
+    )
+
+
+def update_gauge(fig, score, color):
+    """Move the gauge needle/bar without rebuilding the figure."""
+    indicator = fig.data[0]
+    indicator.value = score
+    indicator.gauge.bar.color = color
+    return fig
+
+
+def update_allocation(fig, values):
+    """Change the pie slices without rebuilding the figure."""
+    fig.data[0].values = list(values)
+    return fig
@@ -0,0 +1,180 @@
+"""Risk-model registry and batch RISCO scoring for whole client books.
+
+    python risk_scoring.py allocations.parquet -o scored.parquet --counts counts.csv
+    python risk_scoring.py allocations.csv -o scored.csv --model multi_asset
+
+Models (asset classes, weights, category thresholds) come from
+config/risk_models.json. Input files need one column per asset class of
+the model (case-insensitive, in %); any other columns (e.g. client id)
+are passed through unchanged.
+"""
+import argparse
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+
+CONFIG_PATH = os.environ.get(
+    "RBI_RISK_MODELS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "config", "risk_models.json"),
+)
+INVALID = "Invalid"
+# Scores are rounded before bucketing so float noise (e.g. 75 * 0.4 =
+# 30.000000000000004) never pushes a mix across an inclusive threshold.
+SCORE_DECIMALS = 9
+
+
+class RiskModel:
+    """A risk model compiled into dense arrays.
+
+    weights:    (n_assets,) vector, score = allocations @ weights
+    thresholds: (n_categories - 1,) ascending upper bounds (inclusive)
+    """
+
+    def __init__(self, name, config):
+        self.name = name
+        self.label = config.get("label", name)
+
+        assets = config["assets"]
+        categories = config["categories"]
+        if not assets:
+            raise ValueError(f"Risk model '{name}' has no asset classes")
+        if len(categories) < 1 or any("max" not in c for c in categories[:-1]):
+            raise ValueError(f"Risk model '{name}': every category but the last needs a 'max'")
+
+        self.assets = [a["name"] for a in assets]
+        self.columns = [a["name"].strip().lower() for a in assets]
+        self.defaults = [a.get("default", 0) for a in assets]
+        self.asset_colors = [a.get("color") for a in assets]
+        self.weights = np.array([float(a["weight"]) for a in assets])
+
+        self.categories = [c["name"] for c in categories]
+        self.colors = [c.get("color", "grey") for c in categories]
+        self.bands = [c.get("band", "lightgrey") for c in categories]
+        self.thresholds = np.array([float(c["max"]) for c in categories[:-1]])
+        if np.any(np.diff(self.thresholds) <= 0):
+            raise ValueError(f"Risk model '{name}': category thresholds must increase")
+
+    def score(self, allocations):
+        """Score one allocation (1-D) or many (rows of a 2-D array)."""
+        scores = np.round(np.asarray(allocations, dtype=float) @ self.weights, SCORE_DECIMALS)
+        return float(scores) if scores.ndim == 0 else scores
+
+    def categorize(self, scores):
+        """Category index per score (inclusive upper thresholds)."""
+        return np.digitize(scores, self.thresholds, right=True)
+
+    def category(self, score):
+        """(category, colour) for a single score."""
+        index = int(self.categorize(score))
+        return self.categories[index], self.colors[index]
+
+    def score_allocations(self, allocations, tol=1e-6):
+        """Score a (rows x assets) matrix.
+
+        Returns (scores, category index, valid mask). Rows that don't sum
+        to 100% or hold negative weights get a nan score and index -1.
+        """
+        allocations = np.asarray(allocations, dtype=float)
+        valid = (np.abs(allocations.sum(axis=1) - 100) <= tol) & (allocations >= 0).all(axis=1)
+        scores = np.where(valid, self.score(allocations), np.nan)
+        index = np.where(valid, self.categorize(scores), -1)
+        return scores, index, valid
+
+    def category_counts(self, index):
+        """{category: count}, including how many rows were invalid."""
+        counts = np.bincount(np.asarray(index) + 1, minlength=len(self.categories) + 1)
+        return {INVALID: int(counts[0]), **{c: int(n) for c, n in zip(self.categories, counts[1:])}}
+
+
+@lru_cache(maxsize=None)
+def load_models(path=CONFIG_PATH):
+    """{name: RiskModel} from the config file, plus the default model name."""
+    with open(path) as f:
+        config = json.load(f)
+    models = {name: RiskModel(name, spec) for name, spec in config["models"].items()}
+    default = config.get("default") or next(iter(models))
+    if default not in models:
+        raise ValueError(f"Default risk model '{default}' is not defined in {path}")
+    return models, default
+
+
+def get_model(name=None, path=CONFIG_PATH):
+    """A registered model by name (RBI_RISK_MODEL, then the config's default,
+    when name is None). Raises ValueError for a name that is not registered."""
+    models, default = load_models(path)
+    source = "Risk model"
+    if not name and os.environ.get("RBI_RISK_MODEL"):
+        name, source = os.environ["RBI_RISK_MODEL"], "RBI_RISK_MODEL"
+    name = name or default
+    if name not in models:
+        raise ValueError(f"{source} '{name}' is not defined in {path} "
+                         f"(valid names: {', '.join(models)})")
+    return models[name]
+
+
+# -----------------------------------------------------------
+#                     FILE-BASED SCORING
+# -----------------------------------------------------------
+def read_allocations(source, model=None):
+    """CSV or Parquet allocation file -> DataFrame with lower-case columns."""
+    import pandas as pd
+
+    model = model or get_model()
+    name = str(getattr(source, "name", source)).lower()
+    df = pd.read_parquet(source) if name.endswith((".parquet", ".pq")) else pd.read_csv(source)
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    missing = [c for c in model.columns if c not in df.columns]
+    if missing:
+        raise ValueError(f"Allocation file is missing column(s): {', '.join(missing)}")
+    return df
+
+
+def score_frame(df, model=None):
+    """Add risk_score / category / valid columns; return (df, counts)."""
+    model = model or get_model()
+    scores, index, valid = model.score_allocations(df[model.columns].to_numpy(dtype=float))
+    labels = np.array(model.categories + [INVALID])
+    df = df.assign(risk_score=scores, category=labels[index], valid=valid)
+    return df, model.category_counts(index)
+
+
+def _write(df, path):
+    if str(path).lower().endswith((".parquet", ".pq")):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def score_file(source, output, counts_output=None, model=None):
+    """Score an allocation file, write the results (and counts); return counts."""
+    import pandas as pd
+
+    model = model or get_model()
+    scored, counts = score_frame(read_allocations(source, model), model)
+    _write(scored, output)
+    if counts_output:
+        _write(pd.DataFrame({"category": list(counts), "count": list(counts.values())}), counts_output)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score client allocations with a RISCO risk model.")
+    parser.add_argument("input", help="CSV or Parquet file with one column per asset class")
+    parser.add_argument("-o", "--output", required=True, help="scored CSV or Parquet file")
+    parser.add_argument("--counts", help="optional CSV/Parquet file for category counts")
+    parser.add_argument("--model", help="model name from config/risk_models.json")
+    args = parser.parse_args(argv)
+
+    try:
+        model = get_model(args.model)
+    except ValueError as e:
+        parser.error(str(e))
+    counts = score_file(args.input, args.output, args.counts, model)
+    for category, n in counts.items():
+        print(f"{category:<14} {n:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import os
+from functools import lru_cache
+
+import streamlit as st
+
+from profiling import section
+
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles", "global.css")
+
+
+@lru_cache(maxsize=1)
+def _css():
+    with open(CSS_PATH) as f:
+        return f.read()
+
+
+def apply_theme():
+    """Page config + RBI blue/gold styling; call first on every page."""
+    with section("theme"):
+        st.set_page_config(
+            page_title="RBI Financial Dashboard",
+            layout="wide",
+            page_icon="🏦"
+        )
+        st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)